@@ -0,0 +1,193 @@
+"""Headless batch rendering: python manim_ui.py --batch jobs.json"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import render_core
+import render_options
+import render_timing
+
+# CSV cells are strings; these columns are converted to the job's types
+CSV_NUMBER_COLUMNS = ('font_size', 'scale', 'fade_in_duration', 'wait_duration', 'fade_out_duration',
+                      'render_processes')
+CSV_BOOL_COLUMNS = ('latex', 'gradient')
+
+
+def parse_number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parse_csv_row(row):
+    """Turn a CSV row into a job spec, leaving out empty cells"""
+    spec = {key: value.strip() for key, value in row.items() if key and value and value.strip()}
+    for key in CSV_NUMBER_COLUMNS:
+        if key in spec:
+            spec[key] = parse_number(spec[key])
+    for key in CSV_BOOL_COLUMNS:
+        if key in spec:
+            spec[key] = spec[key].lower() in ('1', 'true', 'yes', 'y')
+    # Several export formats share one cell, e.g. "mp4;gif"
+    if 'formats' in spec:
+        spec['formats'] = [name.strip() for name in spec['formats'].split(";") if name.strip()]
+    # Ladder rungs likewise, each with an optional bitrate, e.g. "1080p=8M;720p"
+    if 'ladder' in spec:
+        rungs = [rung.strip().split("=", 1) for rung in spec['ladder'].split(";") if rung.strip()]
+        spec['ladder'] = {rung[0].strip(): rung[1].strip() if len(rung) > 1 else None for rung in rungs}
+    # Gradient colours come as two columns
+    if 'gradient_color1' in spec or 'gradient_color2' in spec:
+        default = render_options.JOB_DEFAULTS['text']['gradient_colors']
+        spec['gradient_colors'] = (
+            spec.pop('gradient_color1', default[0]),
+            spec.pop('gradient_color2', default[1])
+        )
+    return spec
+
+
+def load_jobs(path, export_dir=None):
+    """Read a JSON or CSV jobs file and return complete export jobs"""
+    defaults = {}
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            data = [parse_csv_row(row) for row in csv.DictReader(f)]
+        else:
+            data = json.load(f)
+            if isinstance(data, dict):
+                defaults = data.get('defaults', {})
+                data = data.get('jobs', [])
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    if export_dir:
+        export_dir = os.path.abspath(export_dir)
+    jobs = []
+    for spec in data:
+        spec = dict(defaults, **spec)
+        if export_dir and not spec.get('export_dir'):
+            spec['export_dir'] = export_dir
+        for key in ('svg_path', 'export_dir'):
+            if spec.get(key):
+                spec[key] = os.path.join(base_dir, os.path.expanduser(spec[key]))
+        jobs.append(render_options.make_job(spec))
+    return jobs
+
+
+def run_one(job):
+    """Render a single job and return its report entry, with its stage timings"""
+    start = time.time()
+    try:
+        output = render_core.run_job(job)
+    except Exception as e:
+        return {'job': job['output_file'], 'error': str(e), 'seconds': time.time() - start,
+                'stages': render_timing.last_timings['stages']}
+    return {'job': job['output_file'], 'output': output, 'seconds': time.time() - start,
+            'stages': render_timing.last_timings['stages']}
+
+
+def run_batch(jobs, workers=None):
+    """Render jobs across a pool of render processes and return a result per job.
+
+    Every process has its own manim config, and every export renders in
+    its own working directory, so jobs never see each other's state.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [run_one(job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=render_core.warm_up
+    ) as pool:
+        futures = [pool.submit(run_one, job) for job in jobs]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # The render process itself died, e.g. a crash inside Cairo
+                results.append({'job': job['output_file'], 'error': f"Render process failed: {e}",
+                                'seconds': 0.0})
+        return results
+
+
+def build_report(results, wall_seconds, workers):
+    """Summarise a batch run: per-job times, failures and totals"""
+    failures = [result for result in results if 'error' in result]
+    return {
+        'jobs': len(results),
+        'succeeded': len(results) - len(failures),
+        'failed': len(failures),
+        'workers': workers,
+        'wall_seconds': wall_seconds,
+        'render_seconds': sum(result['seconds'] for result in results),
+        'results': results
+    }
+
+
+def print_report(report):
+    for result in report['results']:
+        if 'error' in result:
+            print(f"FAILED  {result['job']} ({result['seconds']:.1f}s): {result['error']}")
+        else:
+            print(f"OK      {result['job']} ({result['seconds']:.1f}s): {', '.join(result['output'])}")
+    print(
+        f"{report['succeeded']}/{report['jobs']} jobs rendered on {report['workers']} workers "
+        f"in {report['wall_seconds']:.1f}s ({report['render_seconds']:.1f}s of render time)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="manim_ui.py",
+        description="Render ManimUI animations without the GUI"
+    )
+    parser.add_argument("--batch", required=True, metavar="JOBS",
+                        help="JSON or CSV file with the jobs to render")
+    parser.add_argument("--export-dir", help="export folder for jobs that don't set one")
+    parser.add_argument("--workers", type=int,
+                        help="number of render processes (default: CPU count)")
+    parser.add_argument("--report", metavar="FILE", help="write the batch report as JSON")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile every job with cProfile and write the stats to DIR")
+    parser.add_argument("--stills", metavar="SECONDS", type=float, nargs="+",
+                        help="save the frames at these times as PNGs instead of exporting videos")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_jobs(args.batch, args.export_dir)
+    except (OSError, ValueError) as e:
+        print(f"Could not read {args.batch}: {e}", file=sys.stderr)
+        return 2
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+        for job in jobs:
+            job['profile'] = os.path.abspath(os.path.join(args.profile, f"{job['output_file']}.prof"))
+    if args.stills:
+        for job in jobs:
+            job['kind'] = 'stills'
+            job['times'] = args.stills
+    if not jobs:
+        print(f"No jobs in {args.batch}", file=sys.stderr)
+        return 2
+
+    workers = min(args.workers or os.cpu_count() or 1, len(jobs))
+    start = time.time()
+    results = run_batch(jobs, workers)
+    report = build_report(results, time.time() - start, workers)
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
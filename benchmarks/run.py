@@ -0,0 +1,263 @@
+"""Headless performance benchmarks: python benchmarks/run.py
+
+Every case runs in a fresh process with its own empty caches, so cold
+numbers really are cold and peak memory is measured per case. Results
+are written as JSON and compared against a stored baseline.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import render_options
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results.json")
+
+PREVIEW_CASES = {
+    'text': {'content': "Hello ManimUI", 'latex': False},
+    'mathtex': {'content': r"e^{i\pi} + 1 = 0", 'latex': True},
+    'svg_small': {'svg_shapes': 20},
+    'svg_huge': {'svg_shapes': 5000}
+}
+
+# Export cases keep the wait short, since held frames cost next to nothing
+# and would flatter the frame rate
+EXPORT_SETTINGS = {'content': "Hello ManimUI", 'fade_in_duration': 1, 'wait_duration': 1,
+                   'fade_out_duration': 1}
+ANIMATION_QUALITY = "medium_quality"
+
+# Longest wait for the render process to load manim during the startup case
+STARTUP_TIMEOUT_MS = 120000
+
+
+def write_svg(path, shapes, seed=0):
+    """Write an SVG of random filled curves with the given number of shapes"""
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(shapes):
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+        points = " ".join(
+            f"{x + rng.uniform(-40, 40):.1f},{y + rng.uniform(-40, 40):.1f}" for _ in range(6)
+        )
+        color = f"#{rng.randrange(0x1000000):06x}"
+        paths.append(f'<path d="M {x:.1f},{y:.1f} C {points} Z" fill="{color}"/>')
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1000">\n')
+        f.write("\n".join(paths))
+        f.write("\n</svg>\n")
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def preview_case(name, repeat):
+    import render_core
+
+    settings = dict(PREVIEW_CASES[name])
+    shapes = settings.pop('svg_shapes', None)
+    if shapes is not None:
+        settings['svg_path'] = os.path.abspath(f"{name}.svg")
+        write_svg(settings['svg_path'], shapes)
+    job = render_options.make_job(dict(settings, output_file=name, export_dir="."), kind='preview')
+
+    start = time.perf_counter()
+    render_core.render_preview(job)
+    cold = time.perf_counter() - start
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_core.render_preview(job)
+        warm.append(time.perf_counter() - start)
+    return {
+        f"preview.{name}.cold_seconds": cold,
+        f"preview.{name}.warm_seconds": statistics.median(warm),
+        f"preview.{name}.peak_rss_mb": peak_rss_mb()
+    }
+
+
+def export_case(name, settings):
+    import render_core
+
+    job = render_options.make_job(dict(EXPORT_SETTINGS, output_file="bench", export_dir="exports", **settings))
+    reports = []
+
+    start = time.perf_counter()
+    render_core.render_export(job, progress=reports.append)
+    seconds = time.perf_counter() - start
+    frames = reports[-1]['total_frames'] if reports else 0
+    return {
+        f"export.{name}.seconds": seconds,
+        f"export.{name}.fps": frames / seconds if seconds else 0,
+        f"export.{name}.peak_rss_mb": peak_rss_mb()
+    }
+
+
+def startup_case():
+    """Time from launch until the window shows, and until rendering is ready"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    start = time.perf_counter()
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    import gui
+
+    app = QApplication([])
+    window = gui.ManimUI()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter() - start
+
+    ready = []
+    window.render_thread.render_ready.connect(lambda: (ready.append(time.perf_counter() - start), app.quit()))
+    window.render_thread.render_unavailable.connect(app.quit)
+    QTimer.singleShot(STARTUP_TIMEOUT_MS, app.quit)
+    app.exec()
+    window.close()
+    if not ready:
+        raise RuntimeError("The render process did not become ready")
+    return {
+        "startup.window_seconds": shown,
+        "startup.ready_seconds": ready[0],
+        "startup.peak_rss_mb": peak_rss_mb()
+    }
+
+
+def run_case(kind, name, args):
+    """Run one case in an empty working and cache directory and return its metrics"""
+    work_dir = tempfile.mkdtemp(prefix="manimui_bench_")
+    try:
+        shutil.copy(os.path.join(ROOT, "manim.cfg"), work_dir)
+        os.environ['MANIMUI_CACHE_DIR'] = os.path.join(work_dir, "cache")
+        os.chdir(work_dir)
+        if kind == 'startup':
+            return startup_case()
+        start = time.perf_counter()
+        import render_core  # noqa: F401
+        metrics = {f"{kind}.{name}.import_seconds": time.perf_counter() - start}
+        if kind == 'preview':
+            metrics.update(preview_case(name, *args))
+        else:
+            metrics.update(export_case(name, *args))
+        return metrics
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def list_cases():
+    """All cases as (kind, name, args)"""
+    cases = [('startup', "window", ())]
+    cases += [('preview', name, ()) for name in PREVIEW_CASES]
+    for quality in render_options.QUALITY_OPTIONS.values():
+        cases.append(('export', f"quality.{quality}", ({'quality': quality},)))
+    for animation in render_options.TEXT_ANIMATIONS_IN:
+        cases.append(('export', f"animation_in.{animation}",
+                      ({'fade_in': animation, 'quality': ANIMATION_QUALITY},)))
+    for animation in render_options.TEXT_ANIMATIONS_OUT:
+        cases.append(('export', f"animation_out.{animation}",
+                      ({'fade_out': animation, 'quality': ANIMATION_QUALITY},)))
+    return cases
+
+
+def compare(metrics, baseline, tolerance):
+    """Return a line for every metric that regressed beyond tolerance.
+
+    Frame rates regress when they drop, everything else when it grows.
+    """
+    regressions = []
+    for key, expected in sorted(baseline.items()):
+        actual = metrics.get(key)
+        if not isinstance(actual, (int, float)) or not isinstance(expected, (int, float)) or not expected:
+            continue
+        change = (actual - expected) / expected
+        if key.endswith(".fps"):
+            change = -change
+        if change > tolerance:
+            regressions.append(f"{key}: {actual:.3f} vs baseline {expected:.3f} ({change:+.0%} worse)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the ManimUI performance benchmarks")
+    parser.add_argument("--only", metavar="TEXT", action="append",
+                        help="run only cases whose name contains TEXT (can repeat)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm preview renders per case")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown before a metric counts as a regression (default 0.2)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    cases = list_cases()
+    if args.only:
+        cases = [case for case in cases if any(text in f"{case[0]}.{case[1]}" for text in args.only)]
+
+    metrics = {}
+    for kind, name, case_args in cases:
+        if kind == 'preview':
+            case_args = (args.repeat,)
+        print(f"{kind}.{name} ...", flush=True)
+        # A fresh process per case keeps caches cold and peak memory separate
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as pool:
+            try:
+                metrics.update(pool.submit(run_case, kind, name, case_args).result())
+            except Exception as e:
+                print(f"  failed: {e}")
+                metrics[f"{kind}.{name}.error"] = str(e)
+
+    results = {
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'metrics': metrics
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    for key, value in metrics.items():
+        print(f"{key:60} {value:.3f}" if isinstance(value, float) else f"{key:60} {value}")
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to store one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)['metrics']
+    failed = [key for key in metrics if key.endswith(".error")]
+    regressions = compare(metrics, baseline, args.tolerance)
+    for line in failed + regressions:
+        print(f"REGRESSION  {line}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
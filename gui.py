@@ -0,0 +1,1838 @@
+"""The ManimUI editor window; start it with python manim_ui.py"""
+import sys
+import os
+import math
+
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                           QHBoxLayout, QLabel, QLineEdit, QSpinBox, 
+                           QPushButton, QComboBox, QFileDialog, QTextEdit,
+                           QMessageBox, QRadioButton, QButtonGroup, QCheckBox,
+                           QColorDialog, QSlider, QFrame, QScrollArea, QSizePolicy,
+                           QGridLayout, QMenuBar, QMenu, QTabWidget, QProgressBar,
+                           QInputDialog)
+from PyQt6.QtCore import Qt, QTimer, QThread, QRectF, pyqtSignal
+from PyQt6.QtGui import QPixmap, QImage, QColor, QKeySequence, QShortcut, QAction, QPainter
+from PyQt6.QtSvg import QSvgRenderer
+import tempfile
+import subprocess
+import queue
+import itertools
+import bisect
+import threading
+import render_options
+import render_cache
+import render_timing
+from render_worker import RenderWorker, RenderCancelled
+
+# Manim's frame is 8 units high, and an SVGMobject starts out 2 units high
+MANIM_FRAME_HEIGHT = 8
+SVG_MOBJECT_HEIGHT = 2
+
+# Preview frames are 16:9 with heights rounded up to a multiple of this,
+# so small resizes reuse the frame that is already there
+PREVIEW_SIZE_STEP = 36
+
+# While the window is resized the preview is rescaled at most this often
+RESIZE_THROTTLE_MS = 50
+
+# Text previews render a draft at this fraction of the size first, which
+# the full-size frame then replaces
+PREVIEW_DRAFT_SCALE = 1 / 3
+
+# Quiet period after the last edit before the live preview renders, by
+# default; View > Live Preview Delay changes it, and MANIMUI_PREVIEW_DELAY_MS
+# overrides this default
+PREVIEW_DELAY_MS = int(os.environ.get("MANIMUI_PREVIEW_DELAY_MS", 300))
+
+# Memory kept for frames of the animated preview; the oldest are dropped first
+TIMELINE_MAX_BYTES = 256 * 1024 * 1024
+
+
+# Jobs that render in the background without the busy cursor, and of which
+# only the latest one is worth finishing
+LATEST_ONLY_KINDS = ('timeline', 'frame')
+
+
+class RenderThread(QThread):
+    """Background thread that hands jobs to its own render process, one at a time.
+
+    Every job is a snapshot of the editor's settings that is copied into
+    the render process, where it is rendered under a manim config of its
+    own, so jobs on different threads never share any state.
+    """
+    render_finished = pyqtSignal(object, object)
+    render_failed = pyqtSignal(object, str)
+    render_dropped = pyqtSignal(object)
+    render_cancelled = pyqtSignal(object)
+    render_progress = pyqtSignal(object, object)
+    render_timings = pyqtSignal(object, object)
+    render_ready = pyqtSignal()
+    render_unavailable = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = queue.Queue()
+        self.worker = RenderWorker()
+        self.preview_generation = 0
+        self.latest_jobs = {}
+        self.current_job = None
+        self.cancel_next = False
+        self.lock = threading.Lock()
+        self.job_ids = itertools.count()
+
+    def submit(self, job):
+        # The render process cancels jobs by this id, never by whatever runs
+        job['job_id'] = next(self.job_ids)
+        if job['kind'] in LATEST_ONLY_KINDS:
+            self.latest_jobs[job['kind']] = job
+        if 'generation' in job:
+            self.drop_previews(job['generation'])
+        self.jobs.put(job)
+
+    def is_stale(self, job):
+        """Whether a preview, timeline or frame job has been superseded"""
+        if job['kind'] == 'export':
+            return False
+        if job['generation'] < self.preview_generation:
+            return True
+        return job['kind'] in LATEST_ONLY_KINDS and job is not self.latest_jobs[job['kind']]
+
+    def drop_previews(self, generation):
+        """Drop queued previews older than generation, and stop a stale one that is rendering"""
+        self.preview_generation = generation
+        job = self.current_job
+        if job is not None and self.is_stale(job):
+            self.worker.cancel(job['job_id'])
+
+    def cancel(self):
+        """Cancel the export that is rendering, or the next one if none has started yet"""
+        with self.lock:
+            if self.current_job is not None:
+                self.worker.cancel(self.current_job['job_id'])
+            else:
+                self.cancel_next = True
+
+    def stop(self):
+        self.jobs.put(None)
+        self.worker.stop()
+        self.wait()
+
+    def cancel_and_stop(self):
+        """Drop queued jobs, cancel the one rendering and stop once it has cleaned up"""
+        while True:
+            try:
+                self.jobs.get_nowait()
+            except queue.Empty:
+                break
+        self.jobs.put(None)
+        self.cancel()
+        self.wait()
+        self.worker.stop()
+
+    def run(self):
+        # The render process loads manim while the window is already up.
+        # If it fails here, the first job retries and reports the error.
+        try:
+            self.worker.start()
+            self.worker.wait_ready()
+        except Exception as e:
+            self.render_unavailable.emit(str(e))
+        else:
+            self.render_ready.emit()
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            # Only the newest preview is worth rendering
+            if self.is_stale(job):
+                self.render_dropped.emit(job)
+                continue
+            with self.lock:
+                cancelled = self.cancel_next and job['kind'] == 'export'
+                if cancelled:
+                    self.cancel_next = False
+                else:
+                    self.current_job = job
+            if cancelled:
+                self.render_cancelled.emit(job)
+                continue
+            try:
+                result = self.worker.run(
+                    job,
+                    progress=lambda info, job=job: self.render_progress.emit(job, info),
+                    timings=lambda timings, job=job: self.render_timings.emit(job, timings)
+                )
+            except RenderCancelled:
+                self.render_cancelled.emit(job)
+            except Exception as e:
+                self.render_failed.emit(job, str(e))
+            else:
+                self.render_finished.emit(job, result)
+            finally:
+                with self.lock:
+                    self.current_job = None
+
+class ManimUI(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Manim Text Animation UI")
+        self.setMinimumSize(1200, 800)
+        
+        # Initialize theme
+        self.is_dark_theme = True
+        self.setup_theme()
+        
+        # Create menu bar
+        self.create_menu_bar()
+        
+        # Create status bar
+        self.statusBar().showMessage("Ready")
+        
+        # Initialize recent projects list
+        self.recent_projects = []
+        self.max_recent_projects = 5
+        
+        # Create temporary directory for preview files
+        self.temp_dir = tempfile.mkdtemp()
+        
+        # Rendered previews, so unchanged settings never go back to manim
+        self.preview_cache = render_cache.PreviewCache(
+            max_bytes=128 * 1024 * 1024,
+            disk_dir=render_cache.PREVIEW_DISK_DIR,
+            disk_max_bytes=render_cache.PREVIEW_DISK_MAX_BYTES
+        )
+        
+        # Define available animation methods
+        self.animation_methods = render_options.TEXT_ANIMATIONS_IN
+        self.fade_out_methods = render_options.TEXT_ANIMATIONS_OUT
+        
+        # Quality options with friendly names
+        self.quality_options = render_options.QUALITY_OPTIONS
+        self.export_formats = render_options.EXPORT_FORMATS
+        self.resolution_ladder = render_options.RESOLUTION_LADDER
+        
+        # Create central widget and main layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        # Set up keyboard shortcuts
+        self.setup_shortcuts()
+        
+        # Main horizontal layout to split controls and preview
+        main_layout = QHBoxLayout(central_widget)
+        main_layout.setSpacing(20)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Create tab widget for controls
+        tab_widget = QTabWidget()
+        tab_widget.setMinimumWidth(500)
+        
+        # Create Text Animation tab
+        text_tab = QWidget()
+        text_layout = QVBoxLayout(text_tab)
+        text_layout.setSpacing(15)
+        
+        # Create scroll area for text controls
+        text_scroll = QScrollArea()
+        text_scroll_widget = QWidget()
+        text_scroll_layout = QVBoxLayout(text_scroll_widget)
+        text_scroll.setWidget(text_scroll_widget)
+        text_scroll.setWidgetResizable(True)
+        text_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        text_layout.addWidget(text_scroll)
+        
+        # Project name input
+        project_group = QHBoxLayout()
+        project_group.setSpacing(10)
+        project_label = QLabel("Project Name:")
+        project_label.setMinimumWidth(120)
+        self.project_name = QLineEdit()
+        self.project_name.setMinimumHeight(30)
+        self.project_name.setPlaceholderText("Enter project name...")
+        project_group.addWidget(project_label)
+        project_group.addWidget(self.project_name, stretch=1)
+        text_scroll_layout.addLayout(project_group)
+        
+        # Text/LaTeX mode selection
+        mode_group = QHBoxLayout()
+        mode_group.setSpacing(10)
+        mode_label = QLabel("Render Mode:")
+        mode_label.setMinimumWidth(120)
+        mode_buttons = QHBoxLayout()
+        self.text_mode = QRadioButton("Text")
+        self.latex_mode = QRadioButton("LaTeX")
+        self.text_mode.setChecked(True)
+        mode_buttons.addWidget(self.text_mode)
+        mode_buttons.addWidget(self.latex_mode)
+        mode_buttons.addStretch()
+        mode_group.addWidget(mode_label)
+        mode_group.addLayout(mode_buttons)
+        text_scroll_layout.addLayout(mode_group)
+        
+        # Font size
+        font_group = QHBoxLayout()
+        font_group.setSpacing(10)
+        font_size_label = QLabel("Font Size:")
+        font_size_label.setMinimumWidth(120)
+        self.font_size = QSpinBox()
+        self.font_size.setRange(12, 200)
+        self.font_size.setValue(48)
+        self.font_size.setSingleStep(2)
+        self.font_size.setFixedWidth(100)
+        self.font_size.setMinimumHeight(30)
+        font_group.addWidget(font_size_label)
+        font_group.addWidget(self.font_size)
+        font_group.addStretch()
+        text_scroll_layout.addLayout(font_group)
+        
+        # Color selection section
+        color_section = QVBoxLayout()
+        color_section.setSpacing(10)
+        
+        # Color mode frame
+        mode_frame = QFrame()
+        mode_frame.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Sunken)
+        mode_layout = QVBoxLayout(mode_frame)
+        mode_layout.setSpacing(5)
+        mode_layout.setContentsMargins(10, 10, 10, 10)
+        
+        color_mode_label = QLabel("Color Mode:")
+        mode_layout.addWidget(color_mode_label)
+        
+        self.solid_color_radio = QRadioButton("Solid Color")
+        self.gradient_color_radio = QRadioButton("Gradient Color")
+        self.solid_color_radio.setChecked(True)
+        mode_layout.addWidget(self.solid_color_radio)
+        mode_layout.addWidget(self.gradient_color_radio)
+        
+        color_section.addWidget(mode_frame)
+        
+        # Solid color selection
+        self.solid_color_frame = QFrame()
+        solid_layout = QHBoxLayout(self.solid_color_frame)
+        solid_layout.setSpacing(10)
+        color_label = QLabel("Text Color:")
+        color_label.setMinimumWidth(100)
+        self.color_button = QPushButton()
+        self.color_button.setFixedSize(30, 30)
+        self.current_color = "#FFFFFF"
+        self.update_color_button()
+        solid_layout.addWidget(color_label)
+        solid_layout.addWidget(self.color_button)
+        solid_layout.addStretch()
+        color_section.addWidget(self.solid_color_frame)
+        
+        # Gradient color selection
+        self.gradient_frame = QFrame()
+        gradient_layout = QVBoxLayout(self.gradient_frame)
+        gradient_layout.setSpacing(10)
+        
+        gradient_colors_row = QHBoxLayout()
+        gradient_label = QLabel("Gradient Colors:")
+        gradient_label.setMinimumWidth(100)
+        gradient_colors_row.addWidget(gradient_label)
+        self.gradient_color1_button = QPushButton()
+        self.gradient_color2_button = QPushButton()
+        self.gradient_color1_button.setFixedSize(30, 30)
+        self.gradient_color2_button.setFixedSize(30, 30)
+        self.gradient_color1 = "#FF0000"
+        self.gradient_color2 = "#0000FF"
+        self.update_gradient_buttons()
+        gradient_colors_row.addWidget(self.gradient_color1_button)
+        gradient_colors_row.addWidget(self.gradient_color2_button)
+        gradient_colors_row.addStretch()
+        gradient_layout.addLayout(gradient_colors_row)
+        
+        color_section.addWidget(self.gradient_frame)
+        text_scroll_layout.addLayout(color_section)
+        
+        # Text input section
+        text_group = QVBoxLayout()
+        text_group.setSpacing(5)
+        text_label = QLabel("Enter Text/LaTeX:")
+        self.text_input = QTextEdit()
+        self.text_input.setMinimumHeight(100)
+        text_group.addWidget(text_label)
+        text_group.addWidget(self.text_input)
+        text_scroll_layout.addLayout(text_group)
+        
+        # Animation controls
+        anim_section = QVBoxLayout()
+        anim_section.setSpacing(10)
+        
+        # Fade in controls
+        fade_in_group = QGridLayout()
+        fade_in_group.setSpacing(10)
+        fade_in_label = QLabel("Animation In:")
+        self.fade_in_method = QComboBox()
+        self.fade_in_method.setMinimumHeight(30)
+        self.fade_in_method.setMinimumWidth(200)
+        self.fade_in_method.addItems(self.animation_methods.keys())
+        fade_in_duration_label = QLabel("Duration (s):")
+        self.fade_in_duration = QSpinBox()
+        self.fade_in_duration.setRange(1, 100)
+        self.fade_in_duration.setValue(1)
+        self.fade_in_duration.setFixedWidth(100)
+        self.fade_in_duration.setMinimumHeight(30)
+        fade_in_group.addWidget(fade_in_label, 0, 0)
+        fade_in_group.addWidget(self.fade_in_method, 0, 1)
+        fade_in_group.addWidget(fade_in_duration_label, 1, 0)
+        fade_in_group.addWidget(self.fade_in_duration, 1, 1)
+        anim_section.addLayout(fade_in_group)
+        
+        # Wait duration
+        wait_group = QGridLayout()
+        wait_group.setSpacing(10)
+        wait_label = QLabel("Wait Duration:")
+        wait_duration_label = QLabel("Duration (s):")
+        self.wait_duration = QSpinBox()
+        self.wait_duration.setRange(0, 100)
+        self.wait_duration.setValue(2)
+        self.wait_duration.setFixedWidth(100)
+        self.wait_duration.setMinimumHeight(30)
+        empty_widget = QWidget()
+        empty_widget.setFixedSize(200, 30)
+        wait_group.addWidget(wait_label, 0, 0)
+        wait_group.addWidget(empty_widget, 0, 1)
+        wait_group.addWidget(wait_duration_label, 1, 0)
+        wait_group.addWidget(self.wait_duration, 1, 1)
+        anim_section.addLayout(wait_group)
+        
+        # Fade out controls
+        fade_out_group = QGridLayout()
+        fade_out_group.setSpacing(10)
+        fade_out_label = QLabel("Animation Out:")
+        self.fade_out_method = QComboBox()
+        self.fade_out_method.setMinimumHeight(30)
+        self.fade_out_method.setMinimumWidth(200)
+        self.fade_out_method.addItems(self.fade_out_methods.keys())
+        fade_out_duration_label = QLabel("Duration (s):")
+        self.fade_out_duration = QSpinBox()
+        self.fade_out_duration.setRange(1, 100)
+        self.fade_out_duration.setValue(1)
+        self.fade_out_duration.setFixedWidth(100)
+        self.fade_out_duration.setMinimumHeight(30)
+        fade_out_group.addWidget(fade_out_label, 0, 0)
+        fade_out_group.addWidget(self.fade_out_method, 0, 1)
+        fade_out_group.addWidget(fade_out_duration_label, 1, 0)
+        fade_out_group.addWidget(self.fade_out_duration, 1, 1)
+        anim_section.addLayout(fade_out_group)
+        
+        text_scroll_layout.addLayout(anim_section)
+        
+        # Export controls
+        export_section = QVBoxLayout()
+        export_section.setSpacing(10)
+        
+        export_path_label = QLabel("Export Path:")
+        export_section.addWidget(export_path_label)
+        
+        export_group = QHBoxLayout()
+        export_group.setSpacing(10)
+        self.export_path = QLineEdit()
+        self.export_path.setMinimumHeight(30)
+        self.export_path.setPlaceholderText("Export path...")
+        self.export_path.setReadOnly(True)
+        self.browse_button = QPushButton("Browse")
+        self.browse_button.setMinimumHeight(30)
+        self.browse_button.setFixedWidth(100)
+        export_group.addWidget(self.export_path)
+        export_group.addWidget(self.browse_button)
+        export_section.addLayout(export_group)
+        
+        # Quality selection
+        quality_group = QHBoxLayout()
+        quality_group.setSpacing(10)
+        quality_label = QLabel("Quality:")
+        quality_label.setMinimumWidth(120)
+        self.quality_combo = QComboBox()
+        self.quality_combo.setMinimumHeight(30)
+        self.quality_combo.setMinimumWidth(200)
+        self.quality_combo.addItems(self.quality_options.keys())
+        self.quality_combo.setCurrentText("Medium Quality")
+        quality_group.addWidget(quality_label)
+        quality_group.addWidget(self.quality_combo)
+        processes_label = QLabel("Render Processes:")
+        self.render_processes = QSpinBox()
+        self.render_processes.setRange(1, os.cpu_count() or 1)
+        self.render_processes.setValue(1)
+        self.render_processes.setFixedWidth(100)
+        self.render_processes.setMinimumHeight(30)
+        self.render_processes.setToolTip("Render time slices of the export in parallel processes")
+        quality_group.addWidget(processes_label)
+        quality_group.addWidget(self.render_processes)
+        quality_group.addStretch()
+        export_section.addLayout(quality_group)
+        
+        # Export formats, all encoded from a single render
+        formats_group = QHBoxLayout()
+        formats_group.setSpacing(10)
+        formats_label = QLabel("Formats:")
+        formats_label.setMinimumWidth(120)
+        formats_group.addWidget(formats_label)
+        self.format_checks = {}
+        for name in self.export_formats:
+            check = QCheckBox(name)
+            check.setChecked(self.export_formats[name] == "mp4")
+            self.format_checks[name] = check
+            formats_group.addWidget(check)
+        formats_group.addStretch()
+        export_section.addLayout(formats_group)
+        
+        # Resolution ladder: extra MP4 sizes scaled from the same render
+        ladder_group = QHBoxLayout()
+        ladder_group.setSpacing(10)
+        ladder_label = QLabel("Resolutions:")
+        ladder_label.setMinimumWidth(120)
+        ladder_label.setToolTip("Render once at the largest size and save an MP4 for every ticked size")
+        ladder_group.addWidget(ladder_label)
+        self.ladder_checks = {}
+        for rung in self.resolution_ladder:
+            check = QCheckBox(rung)
+            self.ladder_checks[rung] = check
+            ladder_group.addWidget(check)
+        ladder_group.addStretch()
+        export_section.addLayout(ladder_group)
+        
+        text_scroll_layout.addLayout(export_section)
+        
+        # Action buttons
+        button_section = QVBoxLayout()
+        button_section.setSpacing(10)
+        
+        self.preview_button = QPushButton("Update Preview")
+        self.preview_button.setMinimumHeight(40)
+        button_section.addWidget(self.preview_button)
+        
+        export_buttons = QHBoxLayout()
+        export_buttons.setSpacing(10)
+        self.export_button = QPushButton("Export Animation")
+        self.open_folder_button = QPushButton("Open Export Folder")
+        self.export_button.setMinimumHeight(30)
+        self.open_folder_button.setMinimumHeight(30)
+        export_buttons.addWidget(self.export_button)
+        export_buttons.addWidget(self.open_folder_button)
+        button_section.addLayout(export_buttons)
+        
+        text_scroll_layout.addLayout(button_section)
+        
+        # Create SVG Animation tab
+        svg_tab = QWidget()
+        svg_layout = QVBoxLayout(svg_tab)
+        svg_layout.setSpacing(15)
+        
+        # Create scroll area for SVG controls
+        svg_scroll = QScrollArea()
+        svg_scroll_widget = QWidget()
+        svg_scroll_layout = QVBoxLayout(svg_scroll_widget)
+        svg_scroll.setWidget(svg_scroll_widget)
+        svg_scroll.setWidgetResizable(True)
+        svg_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        svg_layout.addWidget(svg_scroll)
+        
+        # SVG File Selection
+        svg_file_group = QHBoxLayout()
+        svg_file_label = QLabel("SVG File:")
+        svg_file_label.setMinimumWidth(120)
+        self.svg_path = QLineEdit()
+        self.svg_path.setMinimumHeight(30)
+        self.svg_path.setPlaceholderText("Select SVG file...")
+        self.svg_path.setReadOnly(True)
+        self.svg_browse_button = QPushButton("Browse")
+        self.svg_browse_button.setMinimumHeight(30)
+        self.svg_browse_button.setFixedWidth(100)
+        svg_file_group.addWidget(svg_file_label)
+        svg_file_group.addWidget(self.svg_path)
+        svg_file_group.addWidget(self.svg_browse_button)
+        svg_scroll_layout.addLayout(svg_file_group)
+        
+        # Project name input for SVG
+        svg_project_group = QHBoxLayout()
+        svg_project_group.setSpacing(10)
+        svg_project_label = QLabel("Project Name:")
+        svg_project_label.setMinimumWidth(120)
+        self.svg_project_name = QLineEdit()
+        self.svg_project_name.setMinimumHeight(30)
+        self.svg_project_name.setPlaceholderText("Enter project name...")
+        svg_project_group.addWidget(svg_project_label)
+        svg_project_group.addWidget(self.svg_project_name, stretch=1)
+        svg_scroll_layout.addLayout(svg_project_group)
+        
+        # Scale Factor
+        scale_group = QHBoxLayout()
+        scale_label = QLabel("Scale Factor:")
+        scale_label.setMinimumWidth(120)
+        self.scale_factor = QSpinBox()
+        self.scale_factor.setRange(1, 20)
+        self.scale_factor.setValue(4)
+        self.scale_factor.setFixedWidth(100)
+        self.scale_factor.setMinimumHeight(30)
+        scale_group.addWidget(scale_label)
+        scale_group.addWidget(self.scale_factor)
+        scale_group.addStretch()
+        svg_scroll_layout.addLayout(scale_group)
+        
+        # Animation controls for SVG
+        svg_anim_section = QVBoxLayout()
+        svg_anim_section.setSpacing(10)
+        
+        # Fade in controls
+        svg_fade_in_group = QGridLayout()
+        svg_fade_in_group.setSpacing(10)
+        svg_fade_in_label = QLabel("Animation In:")
+        self.svg_fade_in_method = QComboBox()
+        self.svg_fade_in_method.setMinimumHeight(30)
+        self.svg_fade_in_method.setMinimumWidth(200)
+        self.svg_fade_in_method.addItems(render_options.SVG_ANIMATIONS_IN.keys())
+        svg_fade_in_duration_label = QLabel("Duration (s):")
+        self.svg_fade_in_duration = QSpinBox()
+        self.svg_fade_in_duration.setRange(1, 100)
+        self.svg_fade_in_duration.setValue(5)
+        self.svg_fade_in_duration.setFixedWidth(100)
+        self.svg_fade_in_duration.setMinimumHeight(30)
+        svg_fade_in_group.addWidget(svg_fade_in_label, 0, 0)
+        svg_fade_in_group.addWidget(self.svg_fade_in_method, 0, 1)
+        svg_fade_in_group.addWidget(svg_fade_in_duration_label, 1, 0)
+        svg_fade_in_group.addWidget(self.svg_fade_in_duration, 1, 1)
+        svg_anim_section.addLayout(svg_fade_in_group)
+        
+        # Wait duration
+        svg_wait_group = QGridLayout()
+        svg_wait_group.setSpacing(10)
+        svg_wait_label = QLabel("Wait Duration:")
+        svg_wait_duration_label = QLabel("Duration (s):")
+        self.svg_wait_duration = QSpinBox()
+        self.svg_wait_duration.setRange(0, 100)
+        self.svg_wait_duration.setValue(10)
+        self.svg_wait_duration.setFixedWidth(100)
+        self.svg_wait_duration.setMinimumHeight(30)
+        empty_widget = QWidget()
+        empty_widget.setFixedSize(200, 30)
+        svg_wait_group.addWidget(svg_wait_label, 0, 0)
+        svg_wait_group.addWidget(empty_widget, 0, 1)
+        svg_wait_group.addWidget(svg_wait_duration_label, 1, 0)
+        svg_wait_group.addWidget(self.svg_wait_duration, 1, 1)
+        svg_anim_section.addLayout(svg_wait_group)
+        
+        # Fade out controls
+        svg_fade_out_group = QGridLayout()
+        svg_fade_out_group.setSpacing(10)
+        svg_fade_out_label = QLabel("Animation Out:")
+        self.svg_fade_out_method = QComboBox()
+        self.svg_fade_out_method.setMinimumHeight(30)
+        self.svg_fade_out_method.setMinimumWidth(200)
+        self.svg_fade_out_method.addItems(render_options.SVG_ANIMATIONS_OUT.keys())
+        svg_fade_out_duration_label = QLabel("Duration (s):")
+        self.svg_fade_out_duration = QSpinBox()
+        self.svg_fade_out_duration.setRange(1, 100)
+        self.svg_fade_out_duration.setValue(15)
+        self.svg_fade_out_duration.setFixedWidth(100)
+        self.svg_fade_out_duration.setMinimumHeight(30)
+        svg_fade_out_group.addWidget(svg_fade_out_label, 0, 0)
+        svg_fade_out_group.addWidget(self.svg_fade_out_method, 0, 1)
+        svg_fade_out_group.addWidget(svg_fade_out_duration_label, 1, 0)
+        svg_fade_out_group.addWidget(self.svg_fade_out_duration, 1, 1)
+        svg_anim_section.addLayout(svg_fade_out_group)
+        
+        svg_scroll_layout.addLayout(svg_anim_section)
+        
+        # Add preview and export controls for SVG
+        self.svg_preview_button = QPushButton("Update SVG Preview")
+        self.svg_preview_button.setMinimumHeight(40)
+        svg_scroll_layout.addWidget(self.svg_preview_button)
+        
+        # Add export controls for SVG
+        svg_export_section = QVBoxLayout()
+        svg_export_section.setSpacing(10)
+        
+        svg_export_path_label = QLabel("Export Path:")
+        svg_export_section.addWidget(svg_export_path_label)
+        
+        svg_export_group = QHBoxLayout()
+        svg_export_group.setSpacing(10)
+        self.svg_export_path = QLineEdit()
+        self.svg_export_path.setMinimumHeight(30)
+        self.svg_export_path.setPlaceholderText("Export path...")
+        self.svg_export_path.setReadOnly(True)
+        self.svg_browse_export_button = QPushButton("Browse")
+        self.svg_browse_export_button.setMinimumHeight(30)
+        self.svg_browse_export_button.setFixedWidth(100)
+        svg_export_group.addWidget(self.svg_export_path)
+        svg_export_group.addWidget(self.svg_browse_export_button)
+        svg_export_section.addLayout(svg_export_group)
+        
+        # Quality selection for SVG
+        svg_quality_group = QHBoxLayout()
+        svg_quality_group.setSpacing(10)
+        svg_quality_label = QLabel("Quality:")
+        svg_quality_label.setMinimumWidth(120)
+        self.svg_quality_combo = QComboBox()
+        self.svg_quality_combo.setMinimumHeight(30)
+        self.svg_quality_combo.setMinimumWidth(200)
+        self.svg_quality_combo.addItems(self.quality_options.keys())
+        self.svg_quality_combo.setCurrentText("Medium Quality")
+        svg_quality_group.addWidget(svg_quality_label)
+        svg_quality_group.addWidget(self.svg_quality_combo)
+        svg_processes_label = QLabel("Render Processes:")
+        self.svg_render_processes = QSpinBox()
+        self.svg_render_processes.setRange(1, os.cpu_count() or 1)
+        self.svg_render_processes.setValue(1)
+        self.svg_render_processes.setFixedWidth(100)
+        self.svg_render_processes.setMinimumHeight(30)
+        self.svg_render_processes.setToolTip("Render time slices of the export in parallel processes")
+        svg_quality_group.addWidget(svg_processes_label)
+        svg_quality_group.addWidget(self.svg_render_processes)
+        svg_quality_group.addStretch()
+        svg_export_section.addLayout(svg_quality_group)
+        
+        # Export formats, all encoded from a single render
+        svg_formats_group = QHBoxLayout()
+        svg_formats_group.setSpacing(10)
+        svg_formats_label = QLabel("Formats:")
+        svg_formats_label.setMinimumWidth(120)
+        svg_formats_group.addWidget(svg_formats_label)
+        self.svg_format_checks = {}
+        for name in self.export_formats:
+            check = QCheckBox(name)
+            check.setChecked(self.export_formats[name] == "mp4")
+            self.svg_format_checks[name] = check
+            svg_formats_group.addWidget(check)
+        svg_formats_group.addStretch()
+        svg_export_section.addLayout(svg_formats_group)
+        
+        # Resolution ladder: extra MP4 sizes scaled from the same render
+        svg_ladder_group = QHBoxLayout()
+        svg_ladder_group.setSpacing(10)
+        svg_ladder_label = QLabel("Resolutions:")
+        svg_ladder_label.setMinimumWidth(120)
+        svg_ladder_label.setToolTip("Render once at the largest size and save an MP4 for every ticked size")
+        svg_ladder_group.addWidget(svg_ladder_label)
+        self.svg_ladder_checks = {}
+        for rung in self.resolution_ladder:
+            check = QCheckBox(rung)
+            self.svg_ladder_checks[rung] = check
+            svg_ladder_group.addWidget(check)
+        svg_ladder_group.addStretch()
+        svg_export_section.addLayout(svg_ladder_group)
+        
+        svg_scroll_layout.addLayout(svg_export_section)
+        
+        # Add export buttons for SVG
+        svg_button_section = QVBoxLayout()
+        svg_button_section.setSpacing(10)
+        
+        svg_export_buttons = QHBoxLayout()
+        svg_export_buttons.setSpacing(10)
+        self.svg_export_button = QPushButton("Export Animation")
+        self.svg_open_folder_button = QPushButton("Open Export Folder")
+        self.svg_export_button.setMinimumHeight(30)
+        self.svg_open_folder_button.setMinimumHeight(30)
+        svg_export_buttons.addWidget(self.svg_export_button)
+        svg_export_buttons.addWidget(self.svg_open_folder_button)
+        svg_button_section.addLayout(svg_export_buttons)
+        
+        svg_scroll_layout.addLayout(svg_button_section)
+        
+        # Connect SVG export signals
+        self.svg_browse_export_button.clicked.connect(lambda: self.browse_export_path(True))
+        self.svg_export_button.clicked.connect(self.export_svg_animation)
+        self.svg_open_folder_button.clicked.connect(lambda: self.open_export_folder(True))
+        
+        # Connect SVG signals
+        self.svg_browse_button.clicked.connect(self.browse_svg_file)
+        self.svg_preview_button.clicked.connect(self.update_svg_preview)
+        self.scale_factor.valueChanged.connect(self.show_quick_svg_preview)
+        self.scale_factor.valueChanged.connect(lambda: self.schedule_preview('svg'))
+        for combo in (self.svg_fade_in_method, self.svg_fade_out_method, self.svg_quality_combo):
+            combo.currentTextChanged.connect(lambda: self.animation_settings_changed('svg'))
+        for spinbox in (self.svg_fade_in_duration, self.svg_wait_duration, self.svg_fade_out_duration):
+            spinbox.valueChanged.connect(lambda: self.animation_settings_changed('svg'))
+        
+        # Add tabs to tab widget
+        tab_widget.addTab(text_tab, "Text Animation")
+        tab_widget.addTab(svg_tab, "SVG Animation")
+        
+        # Add tab widget to main layout
+        main_layout.addWidget(tab_widget, stretch=0)
+        self.tab_widget = tab_widget
+        
+        # Right panel for preview
+        preview_container = QWidget()
+        preview_layout = QVBoxLayout(preview_container)
+        preview_layout.setSpacing(20)
+        preview_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Preview label and image
+        preview_label = QLabel("Preview:")
+        preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.preview_image = QLabel()
+        self.preview_image.setMinimumSize(640, 480)
+        self.preview_image.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.preview_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.preview_image.setStyleSheet("QLabel { background-color: black; color: white; border: 1px solid #666; }")
+        self.preview_image.setText("Preview will appear here")
+        
+        # Animated preview: low-resolution frames of the whole animation,
+        # shown as they render and played or scrubbed with the slider
+        timeline_layout = QHBoxLayout()
+        self.animate_button = QPushButton("Animate")
+        self.animate_button.setToolTip("Render a quick, low-resolution preview of the whole animation")
+        self.animate_button.clicked.connect(self.start_timeline)
+        self.play_button = QPushButton("Play")
+        self.play_button.setCheckable(True)
+        self.play_button.toggled.connect(self.toggle_timeline_playback)
+        self.timeline_slider = QSlider(Qt.Orientation.Horizontal)
+        self.timeline_slider.valueChanged.connect(self.show_timeline_frame)
+        self.timeline_time = QLabel()
+        timeline_layout.addWidget(self.animate_button)
+        timeline_layout.addWidget(self.play_button)
+        timeline_layout.addWidget(self.timeline_slider, stretch=1)
+        timeline_layout.addWidget(self.timeline_time)
+        self.timeline_frames = render_cache.LRUCache(
+            TIMELINE_MAX_BYTES,
+            sizeof=lambda pixmap: pixmap.width() * pixmap.height() * 4
+        )
+        self.timeline_job = None
+        self.frame_job = None
+        self.timeline_fps = 1
+        self.timeline_rendered = 0
+        self.timeline_shown = False
+        self.timeline_timer = QTimer(self)
+        self.timeline_timer.timeout.connect(self.advance_timeline)
+        self.reset_timeline()
+        
+        preview_layout.addStretch(1)
+        preview_layout.addWidget(preview_label)
+        preview_layout.addWidget(self.preview_image)
+        preview_layout.addLayout(timeline_layout)
+        
+        # Stage timings of the last preview and export, shown on request
+        self.timings_panel = QLabel()
+        self.timings_panel.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.timings_panel.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.timings_panel.setText("No renders timed yet")
+        self.timings_panel.hide()
+        self.last_timings = {}
+        preview_layout.addWidget(self.timings_panel)
+        preview_layout.addStretch(1)
+        
+        # Add preview container to main layout
+        main_layout.addWidget(preview_container, stretch=1)
+        
+        # Previews and exports render on threads and processes of their own,
+        # so previews stay live while exports queue up and render
+        self.render_thread = RenderThread(self)
+        self.export_thread = RenderThread(self)
+        for thread in (self.render_thread, self.export_thread):
+            thread.render_finished.connect(self.on_render_finished)
+            thread.render_failed.connect(self.on_render_failed)
+            thread.render_dropped.connect(self.on_render_dropped)
+            thread.render_cancelled.connect(self.on_render_cancelled)
+            thread.render_progress.connect(self.on_render_progress)
+            thread.render_timings.connect(self.on_render_timings)
+        self.render_thread.render_ready.connect(self.on_render_ready)
+        self.render_thread.render_unavailable.connect(self.on_render_unavailable)
+        # The export process loads manim once previews are ready, so the two
+        # don't compete at startup; if it fails, the first export reports it
+        self.closing = False
+        self.render_thread.render_ready.connect(self.start_export_thread)
+        self.render_thread.render_unavailable.connect(lambda error_msg: self.start_export_thread())
+        
+        # Manim loads in the render process; render controls wait until it is ready
+        self.render_controls = [self.preview_button, self.export_button,
+                                self.svg_preview_button, self.svg_export_button,
+                                self.animate_button]
+        for control in self.render_controls:
+            control.setEnabled(False)
+        self.statusBar().showMessage("Loading Manim...")
+        self.preview_image.setText("Loading Manim...")
+        self.render_thread.start()
+        
+        # Export progress and cancel button, shown in the status bar while exporting
+        self.pending_exports = 0
+        self.export_progress = QProgressBar()
+        self.export_progress.setFixedWidth(360)
+        self.cancel_export_button = QPushButton("Cancel Export")
+        self.cancel_export_button.clicked.connect(self.cancel_export)
+        self.statusBar().addPermanentWidget(self.export_progress)
+        self.statusBar().addPermanentWidget(self.cancel_export_button)
+        self.timings_button = QPushButton("Timings")
+        self.timings_button.setCheckable(True)
+        self.timings_button.setToolTip("Show how long each stage of the last renders took")
+        self.timings_button.toggled.connect(self.timings_panel.setVisible)
+        self.statusBar().addPermanentWidget(self.timings_button)
+        self.export_progress.hide()
+        self.cancel_export_button.hide()
+        
+        # Live preview: edits restart the timer, so a burst of edits only
+        # renders once after preview_delay_ms of quiet
+        self.preview_delay_ms = PREVIEW_DELAY_MS
+        self.preview_generation = 0
+        self.scheduled_preview = None
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self.run_scheduled_preview)
+        
+        # The last preview at full resolution, and versions scaled to the label
+        self.preview_source = None
+        self.preview_source_size = None
+        self.last_preview_source = None
+        self.scaled_previews = render_cache.LRUCache(
+            64 * 1024 * 1024,
+            sizeof=lambda pixmap: pixmap.width() * pixmap.height() * 4
+        )
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self.display_preview)
+        self.resize_rerender_timer = QTimer(self)
+        self.resize_rerender_timer.setSingleShot(True)
+        self.resize_rerender_timer.timeout.connect(self.rerender_resized_preview)
+        
+        # Qt's SVG renderer for the instant SVG preview, kept while the file is unchanged
+        self.quick_svg_renderer = None
+        self.quick_svg_key = None
+        
+        # Initialize color mode after all UI elements are created
+        self.update_color_mode()
+        
+        # Initialize tooltips
+        self.setup_tooltips()
+        
+        # Connect buttons
+        self.connect_signals()
+
+    def update_color_mode(self):
+        # Show/hide appropriate color controls based on selected mode
+        use_gradient = self.gradient_color_radio.isChecked()
+        self.solid_color_frame.setVisible(not use_gradient)
+        self.gradient_frame.setVisible(use_gradient)
+        
+        # Refresh the preview when changing color mode
+        if self.text_input.toPlainText():
+            self.schedule_preview('text')
+
+    def browse_export_path(self, for_svg=False):
+        folder = QFileDialog.getExistingDirectory(self, "Select Export Folder")
+        if folder:
+            if for_svg:
+                self.svg_export_path.setText(folder)
+            else:
+                self.export_path.setText(folder)
+
+    def validate_inputs(self):
+        if not self.text_input.toPlainText():
+            QMessageBox.warning(self, "Input Error", "Please enter some text first!")
+            return False
+        if not self.project_name.text():
+            QMessageBox.warning(self, "Input Error", "Please enter a project name!")
+            return False
+        return True
+
+    def checked_formats(self, format_checks):
+        return [self.export_formats[name] for name, check in format_checks.items() if check.isChecked()]
+
+    def snapshot_text_job(self):
+        """Take a snapshot of the Text Animation tab for the render thread"""
+        return render_options.normalize_job({
+            'source': 'text',
+            'content': self.text_input.toPlainText(),
+            'latex': self.latex_mode.isChecked(),
+            'font_size': self.font_size.value(),
+            'gradient': self.gradient_color_radio.isChecked(),
+            'color': self.current_color,
+            'gradient_colors': (self.gradient_color1, self.gradient_color2),
+            'fade_in': self.fade_in_method.currentText(),
+            'fade_in_duration': self.fade_in_duration.value(),
+            'wait_duration': self.wait_duration.value(),
+            'fade_out': self.fade_out_method.currentText(),
+            'fade_out_duration': self.fade_out_duration.value(),
+            'quality': self.quality_options[self.quality_combo.currentText()],
+            'formats': self.checked_formats(self.format_checks),
+            'ladder': [rung for rung, check in self.ladder_checks.items() if check.isChecked()],
+            'render_processes': self.render_processes.value(),
+            'output_file': self.project_name.text(),
+            'export_dir': self.export_path.text()
+        })
+
+    def snapshot_svg_job(self):
+        """Take a snapshot of the SVG Animation tab for the render thread"""
+        return render_options.normalize_job({
+            'source': 'svg',
+            'svg_path': self.svg_path.text(),
+            'scale': self.scale_factor.value(),
+            'fade_in': self.svg_fade_in_method.currentText(),
+            'fade_in_duration': self.svg_fade_in_duration.value(),
+            'wait_duration': self.svg_wait_duration.value(),
+            'fade_out': self.svg_fade_out_method.currentText(),
+            'fade_out_duration': self.svg_fade_out_duration.value(),
+            'quality': self.quality_options[self.svg_quality_combo.currentText()],
+            'formats': self.checked_formats(self.svg_format_checks),
+            'ladder': [rung for rung, check in self.svg_ladder_checks.items() if check.isChecked()],
+            'render_processes': self.svg_render_processes.value(),
+            'output_file': self.svg_project_name.text(),
+            'export_dir': self.svg_export_path.text()
+        })
+
+    def submit_render(self, kind, job):
+        job['kind'] = kind
+        if self.profile_action.isChecked():
+            self.profile_action.setChecked(False)
+            job['profile'] = True
+        # Only previews are waited for; exports, timelines and frames render
+        # in the background while the editor stays usable
+        if kind == 'preview':
+            self.show_loading_indicator(True)
+        if kind == 'export':
+            self.pending_exports += 1
+            if self.pending_exports == 1:
+                self.export_progress.setRange(0, 0)
+                self.export_progress.setFormat("Preparing export...")
+            self.export_progress.show()
+            self.cancel_export_button.setEnabled(True)
+            self.cancel_export_button.show()
+            self.statusBar().showMessage(self.idle_message())
+            self.export_thread.submit(job)
+        else:
+            self.render_thread.submit(job)
+
+    def export_done(self):
+        self.pending_exports -= 1
+        self.statusBar().showMessage(self.idle_message())
+        if self.pending_exports == 0:
+            self.export_progress.hide()
+            self.cancel_export_button.hide()
+        else:
+            self.export_progress.setRange(0, 0)
+            self.export_progress.setFormat("Preparing export...")
+            self.cancel_export_button.setEnabled(True)
+
+    def cancel_export(self):
+        self.cancel_export_button.setEnabled(False)
+        self.export_progress.setFormat("Cancelling...")
+        self.export_thread.cancel()
+
+    def format_seconds(self, seconds):
+        seconds = int(round(seconds))
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    def on_render_progress(self, job, info):
+        if job['kind'] == 'timeline':
+            self.add_timeline_frame(job, info)
+            return
+        eta = "--:--" if info['eta'] is None else self.format_seconds(info['eta'])
+        self.export_progress.setRange(0, info['total_frames'])
+        self.export_progress.setValue(info['frames'])
+        queued = f" (+{self.pending_exports - 1} queued)" if self.pending_exports > 1 else ""
+        self.export_progress.setFormat(
+            f"{job['output_file']}{queued} - {info['animation']}: %v/%m frames, "
+            f"{self.format_seconds(info['elapsed'])} elapsed, ETA {eta}"
+        )
+
+    def on_render_ready(self):
+        for control in self.render_controls:
+            control.setEnabled(True)
+        if self.preview_image.text() == "Loading Manim...":
+            self.preview_image.setText("Preview will appear here")
+        if self.statusBar().currentMessage() == "Loading Manim...":
+            self.statusBar().showMessage("Ready")
+
+    def on_render_unavailable(self, error_msg):
+        # Leave the controls usable so the next render retries and reports the error
+        for control in self.render_controls:
+            control.setEnabled(True)
+        self.statusBar().showMessage(f"Render process failed to start: {error_msg}")
+        self.preview_image.setText(f"Render process failed to start:\n{error_msg}")
+
+    def on_render_timings(self, job, timings):
+        if timings is None:
+            return
+        titles = {'preview': "Preview", 'timeline': "Animated preview", 'frame': "Animated preview frame"}
+        title = titles.get(job['kind'], f"Export of {job['output_file']}")
+        self.last_timings[job['kind']] = f"{title}\n{render_timing.format_timings(timings)}"
+        self.timings_panel.setText("\n\n".join(self.last_timings.values()))
+        if 'profile' in timings:
+            self.statusBar().showMessage(f"Profile saved to {timings['profile']}")
+
+    def on_render_dropped(self, job):
+        if job['kind'] == 'preview':
+            self.show_loading_indicator(False)
+
+    def on_render_cancelled(self, job):
+        if job['kind'] in LATEST_ONLY_KINDS:
+            return
+        # Previews are only cancelled once they are out of date
+        if job['kind'] == 'preview':
+            self.show_loading_indicator(False)
+            return
+        self.export_done()
+        self.statusBar().showMessage(f"Export of {job['output_file']} cancelled")
+
+    def on_render_finished(self, job, result):
+        if job['kind'] == 'timeline':
+            if job is self.timeline_job:
+                self.statusBar().showMessage("Animated preview ready")
+            return
+        if job['kind'] == 'frame':
+            self.show_timeline_frame_data(job, result)
+            return
+        if job['kind'] == 'export':
+            self.export_done()
+        if job['kind'] == 'preview':
+            self.show_loading_indicator(False)
+            self.preview_cache.put(job['cache_key'], result)
+            # A newer preview has been requested since, so don't show this one
+            if job['generation'] == self.preview_generation:
+                self.preview_source_size = job['preview_size']
+                self.show_preview_data(result)
+            return
+
+        is_svg = job['source'] == 'svg'
+        if is_svg:
+            QMessageBox.information(self, "Success", "SVG Animation exported successfully!")
+        else:
+            QMessageBox.information(self, "Success", "Animation exported successfully!")
+        
+        # Open the folder this export went to, whatever the editor shows now
+        self.open_export_folder(is_svg=is_svg, export_path=job['export_dir'])
+        
+        # Add to recent projects
+        self.add_recent_project(job['output_file'], job['export_dir'])
+
+    def on_render_failed(self, job, error_msg):
+        if job['kind'] == 'timeline':
+            if job is self.timeline_job:
+                self.statusBar().showMessage(f"Animated preview failed: {error_msg}")
+            return
+        if job['kind'] == 'frame':
+            if job is self.frame_job:
+                self.statusBar().showMessage(f"Animated preview frame failed: {error_msg}")
+            return
+        prefix = "SVG Preview" if job['source'] == 'svg' else "Preview"
+        if job['kind'] == 'preview':
+            self.show_loading_indicator(False)
+            if job['generation'] != self.preview_generation:
+                return
+            self.statusBar().showMessage(f"{prefix} failed: {error_msg}")
+            self.preview_image.setText(f"{prefix} failed:\n{error_msg}")
+        else:
+            self.export_done()
+            what = "SVG animation" if job['source'] == 'svg' else "animation"
+            self.statusBar().showMessage(f"Export failed: {error_msg}")
+            QMessageBox.critical(self, "Error", f"Failed to export {what}:\n{error_msg}")
+
+    def export_animation(self):
+        if not self.validate_inputs():
+            return
+            
+        if not self.export_path.text():
+            QMessageBox.warning(self, "Error", "Please select an export path first!")
+            return
+            
+        if not self.checked_formats(self.format_checks):
+            QMessageBox.warning(self, "Error", "Please select at least one export format!")
+            return
+
+        if "mp4" not in self.checked_formats(self.format_checks) and any(
+                check.isChecked() for check in self.ladder_checks.values()):
+            QMessageBox.warning(self, "Error", "Resolutions are MP4 sizes, please tick MP4 too!")
+            return
+            
+        self.submit_render('export', self.snapshot_text_job())
+
+    def open_export_folder(self, is_svg=False, export_path=None):
+        if export_path is None:
+            export_path = self.svg_export_path.text() if is_svg else self.export_path.text()
+        if not export_path:
+            QMessageBox.warning(self, "Error", "No export folder selected!")
+            return
+            
+        if sys.platform == 'darwin':  # macOS
+            subprocess.run(['open', export_path])
+        elif sys.platform == 'win32':  # Windows
+            subprocess.run(['explorer', export_path])
+        else:  # Linux
+            subprocess.run(['xdg-open', export_path])
+
+    def start_export_thread(self):
+        # Stopping the render thread on close also ends up here, and a
+        # closed window has no use for another render process
+        if not self.closing:
+            self.export_thread.start()
+
+    def closeEvent(self, event):
+        if self.pending_exports:
+            answer = QMessageBox.question(
+                self, "Exports Running",
+                f"{self.pending_exports} export(s) have not finished yet. Cancel them and quit?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+
+        self.closing = True
+        # Shut down the render threads and their render processes. A
+        # cancelled export removes its work folder and stops ffmpeg itself,
+        # so its process is only stopped after that.
+        self.render_thread.stop()
+        self.statusBar().showMessage("Cancelling exports...")
+        QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+        try:
+            self.export_thread.cancel_and_stop()
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        # Clean up temporary files when closing the application
+        try:
+            import shutil
+            shutil.rmtree(self.temp_dir)
+        except:
+            pass
+        super().closeEvent(event)
+
+    def update_color_button(self):
+        self.color_button.setStyleSheet(
+            f"background-color: {self.current_color}; border: 1px solid #666;"
+        )
+        
+    def update_gradient_buttons(self):
+        self.gradient_color1_button.setStyleSheet(
+            f"background-color: {self.gradient_color1}; border: 1px solid #666;"
+        )
+        self.gradient_color2_button.setStyleSheet(
+            f"background-color: {self.gradient_color2}; border: 1px solid #666;"
+        )
+        
+    def choose_color(self):
+        color = QColorDialog.getColor(QColor(self.current_color))
+        if color.isValid():
+            self.current_color = color.name()
+            self.update_color_button()
+            self.update_preview()
+            
+    def choose_gradient_color(self, button_num):
+        if button_num == 1:
+            color = QColorDialog.getColor(QColor(self.gradient_color1))
+            if color.isValid():
+                self.gradient_color1 = color.name()
+        else:
+            color = QColorDialog.getColor(QColor(self.gradient_color2))
+            if color.isValid():
+                self.gradient_color2 = color.name()
+        self.update_gradient_buttons()
+        self.update_preview()
+
+    def schedule_preview(self, source):
+        """Refresh the text or SVG preview once edits have been quiet for a moment"""
+        self.scheduled_preview = source
+        self.preview_timer.start(self.preview_delay_ms)
+
+    def animation_settings_changed(self, source):
+        """Put the still preview back in place of an animated preview that is out of date"""
+        if self.timeline_job is not None or self.timeline_shown:
+            self.schedule_preview(source)
+
+    def run_scheduled_preview(self):
+        if self.scheduled_preview == 'svg':
+            self.update_svg_preview()
+        else:
+            self.update_preview()
+
+    def update_preview(self):
+        self.preview_timer.stop()
+        self.preview_generation += 1
+        self.last_preview_source = 'text'
+        self.reset_timeline()
+        if not self.text_input.toPlainText():
+            self.render_thread.drop_previews(self.preview_generation)
+            self.preview_image.clear()
+            self.preview_image.setText("Preview will appear here")
+            return
+
+        self.request_preview(self.snapshot_text_job())
+
+    def request_preview(self, job):
+        """Show a preview from the cache, or render it if it isn't cached.
+
+        Text previews that aren't cached render twice: first a small draft
+        that shows up almost at once, then the full-size frame. The full
+        render is cancelled if the settings change before it is done.
+        """
+        job['generation'] = self.preview_generation
+        job['preview_size'] = self.preview_device_size()
+        job['cache_key'] = render_cache.preview_key(job)
+        # The render process keeps full-size frames on disk, but not drafts
+        job['save_preview'] = True
+        data = self.preview_cache.get(job['cache_key'])
+        if data is not None:
+            self.render_thread.drop_previews(self.preview_generation)
+            self.preview_source_size = job['preview_size']
+            self.show_preview_data(data)
+            return
+
+        # SVGs get an instant draft from Qt instead (see show_quick_svg_preview)
+        draft_size = self.preview_device_size(PREVIEW_DRAFT_SCALE)
+        if job['source'] == 'text' and draft_size != job['preview_size']:
+            draft = dict(job, preview_size=draft_size, save_preview=False)
+            draft['cache_key'] = render_cache.preview_key(draft)
+            data = self.preview_cache.get(draft['cache_key'])
+            if data is not None:
+                self.preview_source_size = draft_size
+                self.show_preview_data(data)
+            else:
+                self.submit_render('preview', draft)
+        self.submit_render('preview', job)
+
+    def show_preview_data(self, frame):
+        self.timeline_shown = False
+        self.show_preview_pixmap(self.frame_pixmap(frame))
+
+    def frame_pixmap(self, frame):
+        # Wrap the renderer's RGBA frame without copying it
+        height, width = frame.shape[:2]
+        image = QImage(frame.data, width, height, frame.strides[0], QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(image)
+
+    def start_timeline(self):
+        """Render the animation of the current tab as a scrubbable timeline"""
+        if self.tab_widget.currentIndex() == 1:
+            if not self.svg_path.text():
+                QMessageBox.warning(self, "Input Error", "Please select an SVG file first!")
+                return
+            job = self.snapshot_svg_job()
+        else:
+            if not self.text_input.toPlainText():
+                QMessageBox.warning(self, "Input Error", "Please enter some text first!")
+                return
+            job = self.snapshot_text_job()
+        self.reset_timeline()
+        job['generation'] = self.preview_generation
+        self.timeline_job = job
+        self.statusBar().showMessage("Rendering animated preview...")
+        self.submit_render('timeline', job)
+
+    def reset_timeline(self):
+        """Forget the frames of the last timeline, whose settings are out of date"""
+        self.timeline_job = None
+        self.timeline_frames.clear()
+        self.timeline_starts = []
+        self.timeline_rendered = 0
+        self.timeline_shown = False
+        self.play_button.setChecked(False)
+        self.play_button.setEnabled(False)
+        self.timeline_slider.blockSignals(True)
+        self.timeline_slider.setRange(0, 0)
+        self.timeline_slider.blockSignals(False)
+        self.timeline_slider.setEnabled(False)
+        self.timeline_time.setText("0.0 s")
+
+    def add_timeline_frame(self, job, info):
+        if job is not self.timeline_job:
+            return
+        # A held frame is stored once, under the index of its first copy
+        self.timeline_frames.put(info['index'], self.frame_pixmap(info['frame']))
+        self.timeline_starts.append(info['index'])
+        self.timeline_rendered = info['index'] + info['count']
+        self.timeline_fps = info['fps']
+        self.timeline_slider.setMaximum(max(info['total_frames'], self.timeline_rendered) - 1)
+        self.timeline_slider.setEnabled(True)
+        self.play_button.setEnabled(True)
+        # Show the first frame as soon as it arrives
+        if info['index'] == 0:
+            self.show_timeline_frame(self.timeline_slider.value())
+
+    def show_timeline_frame(self, index):
+        self.timeline_time.setText(f"{index / self.timeline_fps:.1f} s")
+        pixmap = None
+        if index < self.timeline_rendered:
+            start = self.timeline_starts[bisect.bisect_right(self.timeline_starts, index) - 1]
+            pixmap = self.timeline_frames.get(start)
+        if pixmap is not None:
+            self.timeline_shown = True
+            self.show_preview_pixmap(pixmap)
+        elif index < self.timeline_rendered and not self.play_button.isChecked():
+            # Dropped from memory, so render just this frame on its own
+            self.request_timeline_frame(index)
+
+    def request_timeline_frame(self, index):
+        job = dict(self.timeline_job, time=index / self.timeline_fps, timeline_index=index)
+        job['preview_size'] = self.preview_device_size()
+        job.pop('profile', None)
+        self.frame_job = job
+        self.submit_render('frame', job)
+
+    def show_timeline_frame_data(self, job, frame):
+        """Show a frame rendered by request_timeline_frame if it is still wanted"""
+        if (job is self.frame_job and self.timeline_job is not None
+                and job['generation'] == self.preview_generation
+                and job['timeline_index'] == self.timeline_slider.value()):
+            self.timeline_shown = True
+            self.show_preview_pixmap(self.frame_pixmap(frame))
+
+    def toggle_timeline_playback(self, playing):
+        self.play_button.setText("Pause" if playing else "Play")
+        if playing:
+            if self.timeline_slider.value() >= self.timeline_slider.maximum():
+                self.timeline_slider.setValue(0)
+            self.timeline_timer.start(round(1000 / self.timeline_fps))
+        else:
+            self.timeline_timer.stop()
+
+    def advance_timeline(self):
+        index = self.timeline_slider.value() + 1
+        if index > self.timeline_slider.maximum():
+            self.play_button.setChecked(False)
+        # Wait for frames that are still rendering
+        elif index < self.timeline_rendered:
+            self.timeline_slider.setValue(index)
+
+    def show_preview_pixmap(self, pixmap):
+        """Show a full-resolution preview, keeping it for later rescaling"""
+        self.preview_source = pixmap
+        self.display_preview()
+
+    def preview_device_size(self, scale=1):
+        """Device-pixel size of a 16:9 frame filling the preview label, rounded up.
+
+        scale shrinks the frame, e.g. for a draft.
+        """
+        ratio = self.preview_image.devicePixelRatioF()
+        size = self.preview_image.size()
+        height = min(size.height(), size.width() * 9 / 16) * ratio * scale
+        height = max(1, math.ceil(height / PREVIEW_SIZE_STEP)) * PREVIEW_SIZE_STEP
+        return (height * 16 // 9, height)
+
+    def display_preview(self):
+        """Show preview_source scaled to the label's size in device pixels"""
+        if self.preview_source is None:
+            return
+        ratio = self.preview_image.devicePixelRatioF()
+        width = round(self.preview_image.width() * ratio)
+        height = round(self.preview_image.height() * ratio)
+        key = (self.preview_source.cacheKey(), width, height)
+        scaled_pixmap = self.scaled_previews.get(key)
+        if scaled_pixmap is None:
+            scaled_pixmap = self.preview_source.scaled(
+                width,
+                height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            scaled_pixmap.setDevicePixelRatio(ratio)
+            self.scaled_previews.put(key, scaled_pixmap)
+        self.preview_image.setPixmap(scaled_pixmap)
+        self.preview_image.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def rerender_resized_preview(self):
+        """Render the preview again once resizing has settled on a new size"""
+        if self.timeline_shown:
+            return
+        if self.showing_preview() and self.preview_device_size() != self.preview_source_size:
+            if self.last_preview_source == 'svg':
+                self.update_svg_preview()
+            elif self.last_preview_source == 'text':
+                self.update_preview()
+
+    def showing_preview(self):
+        # An empty pixmap means the label shows a message instead
+        pixmap = self.preview_image.pixmap()
+        return pixmap is not None and not pixmap.isNull()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.showing_preview():
+            return
+        # Rescale from the full-resolution source at most every
+        # RESIZE_THROTTLE_MS, and render a sharper frame once resizing stops
+        if not self.resize_timer.isActive():
+            self.resize_timer.start(RESIZE_THROTTLE_MS)
+        self.resize_rerender_timer.start(self.preview_delay_ms)
+
+    def setup_shortcuts(self):
+        # Update Preview shortcut (Cmd+R or Ctrl+R)
+        preview_shortcut = QShortcut(QKeySequence.StandardKey.Refresh, self)
+        preview_shortcut.activated.connect(self.update_preview)
+        
+        # Export shortcut (Cmd+E or Ctrl+E)
+        export_shortcut = QShortcut(QKeySequence("Ctrl+E"), self)
+        export_shortcut.activated.connect(self.export_animation)
+        
+        # Toggle theme shortcut (Cmd+T or Ctrl+T)
+        theme_shortcut = QShortcut(QKeySequence("Ctrl+T"), self)
+        theme_shortcut.activated.connect(self.toggle_theme)
+
+    def setup_tooltips(self):
+        # Project name tooltip
+        self.project_name.setToolTip("Enter a name for your animation project")
+        
+        # Render mode tooltips
+        self.text_mode.setToolTip("Render text as plain text")
+        self.latex_mode.setToolTip("Render text using LaTeX formatting")
+        
+        # Font size tooltip
+        self.font_size.setToolTip("Adjust the size of the text (24-96)")
+        
+        # Color tooltips
+        self.color_button.setToolTip("Click to choose a solid color")
+        self.gradient_color1_button.setToolTip("Click to choose the starting gradient color")
+        self.gradient_color2_button.setToolTip("Click to choose the ending gradient color")
+        
+        # Animation tooltips
+        self.fade_in_method.setToolTip("Choose how the text appears")
+        self.fade_out_method.setToolTip("Choose how the text disappears")
+        self.fade_in_duration.setToolTip("Duration of the entrance animation (seconds)")
+        self.wait_duration.setToolTip("How long to display the text (seconds)")
+        self.fade_out_duration.setToolTip("Duration of the exit animation (seconds)")
+        
+        # Quality tooltip
+        self.quality_combo.setToolTip("Select the rendering quality (higher quality takes longer)")
+
+    def show_loading_indicator(self, show=True):
+        if show:
+            self.statusBar().showMessage("Rendering... Please wait")
+            QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.statusBar().showMessage(self.idle_message())
+            QApplication.restoreOverrideCursor()
+
+    def idle_message(self):
+        """Status bar message when no preview is rendering"""
+        if self.pending_exports:
+            return f"Exporting in the background ({self.pending_exports} pending)"
+        return "Ready"
+
+    def add_recent_project(self, name, path):
+        project = {'name': name, 'path': path}
+        if project in self.recent_projects:
+            self.recent_projects.remove(project)
+        self.recent_projects.insert(0, project)
+        if len(self.recent_projects) > self.max_recent_projects:
+            self.recent_projects.pop()
+        self.update_recent_menu()
+
+    def load_recent_project(self, project):
+        self.project_name.setText(project['name'])
+        self.export_path.setText(project['path'])
+
+    def toggle_theme(self):
+        self.is_dark_theme = not self.is_dark_theme
+        self.setup_theme()
+        theme_name = "Dark" if self.is_dark_theme else "Light"
+        self.statusBar().showMessage(f"Switched to {theme_name} theme")
+
+    def show_error_dialog(self, title, message, details=None):
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Icon.Critical)
+        msg.setWindowTitle(title)
+        msg.setText(message)
+        if details:
+            msg.setDetailedText(details)
+        msg.exec()
+
+    def create_menu_bar(self):
+        menubar = self.menuBar()
+        
+        # File menu
+        file_menu = menubar.addMenu("File")
+        
+        # Recent projects submenu
+        self.recent_menu = QMenu("Recent Projects", self)
+        file_menu.addMenu(self.recent_menu)
+        
+        # Add other menu items
+        export_action = QAction("Export Animation", self)
+        export_action.setShortcut("Ctrl+E")
+        export_action.triggered.connect(self.export_animation)
+        file_menu.addAction(export_action)
+        
+        # View menu
+        view_menu = menubar.addMenu("View")
+        
+        # Theme toggle
+        theme_action = QAction("Toggle Theme", self)
+        theme_action.setShortcut("Ctrl+T")
+        theme_action.triggered.connect(self.toggle_theme)
+        view_menu.addAction(theme_action)
+        
+        # Update preview action
+        preview_action = QAction("Update Preview", self)
+        preview_action.setShortcut(QKeySequence.StandardKey.Refresh)
+        preview_action.triggered.connect(self.update_preview)
+        view_menu.addAction(preview_action)
+        
+        # How long the live preview waits for edits to stop
+        delay_action = QAction("Live Preview Delay...", self)
+        delay_action.triggered.connect(self.choose_preview_delay)
+        view_menu.addAction(delay_action)
+        
+        # Profile the next preview or export with cProfile
+        self.profile_action = QAction("Profile Next Render", self)
+        self.profile_action.setCheckable(True)
+        view_menu.addAction(self.profile_action)
+
+    def choose_preview_delay(self):
+        delay, ok = QInputDialog.getInt(
+            self, "Live Preview Delay",
+            "Render the preview once edits have stopped for (ms):",
+            self.preview_delay_ms, 0, 5000, 50
+        )
+        if ok:
+            self.preview_delay_ms = delay
+
+    def update_recent_menu(self):
+        self.recent_menu.clear()
+        for project in self.recent_projects:
+            action = QAction(f"{project['name']} ({project['path']})", self)
+            action.triggered.connect(lambda p=project: self.load_recent_project(p))
+            self.recent_menu.addAction(action)
+
+    def setup_theme(self):
+        if self.is_dark_theme:
+            self.setStyleSheet("""
+                QMainWindow {
+                    background-color: #2b2b2b;
+                    color: #ffffff;
+                }
+                QWidget {
+                    background-color: #2b2b2b;
+                    color: #ffffff;
+                }
+                QLabel {
+                    color: #ffffff;
+                }
+                QLineEdit, QTextEdit, QSpinBox, QComboBox {
+                    background-color: #3b3b3b;
+                    color: #ffffff;
+                    border: 1px solid #555555;
+                    border-radius: 3px;
+                    padding: 2px;
+                }
+                QPushButton {
+                    background-color: #4b4b4b;
+                    color: #ffffff;
+                    border: 1px solid #555555;
+                    border-radius: 3px;
+                    padding: 5px;
+                }
+                QPushButton:hover {
+                    background-color: #5b5b5b;
+                }
+                QPushButton:pressed {
+                    background-color: #3b3b3b;
+                }
+                QScrollArea {
+                    border: 1px solid #555555;
+                }
+                QFrame {
+                    border: 1px solid #555555;
+                }
+                QMenuBar {
+                    background-color: #2b2b2b;
+                    color: #ffffff;
+                }
+                QMenuBar::item:selected {
+                    background-color: #4b4b4b;
+                }
+                QMenu {
+                    background-color: #2b2b2b;
+                    color: #ffffff;
+                }
+                QMenu::item:selected {
+                    background-color: #4b4b4b;
+                }
+                QRadioButton {
+                    color: #ffffff;
+                }
+                QRadioButton::indicator {
+                    border: 1px solid #555555;
+                    border-radius: 7px;
+                }
+                QRadioButton::indicator:checked {
+                    background-color: #4b9eff;
+                }
+            """)
+        else:
+            self.setStyleSheet("""
+                QMainWindow {
+                    background-color: #f0f0f0;
+                    color: #000000;
+                }
+                QWidget {
+                    background-color: #f0f0f0;
+                    color: #000000;
+                }
+                QLabel {
+                    color: #000000;
+                }
+                QLineEdit, QTextEdit, QSpinBox, QComboBox {
+                    background-color: #ffffff;
+                    color: #000000;
+                    border: 1px solid #cccccc;
+                    border-radius: 3px;
+                    padding: 2px;
+                }
+                QPushButton {
+                    background-color: #e0e0e0;
+                    color: #000000;
+                    border: 1px solid #cccccc;
+                    border-radius: 3px;
+                    padding: 5px;
+                }
+                QPushButton:hover {
+                    background-color: #d0d0d0;
+                }
+                QPushButton:pressed {
+                    background-color: #c0c0c0;
+                }
+                QScrollArea {
+                    border: 1px solid #cccccc;
+                }
+                QFrame {
+                    border: 1px solid #cccccc;
+                }
+                QMenuBar {
+                    background-color: #f0f0f0;
+                    color: #000000;
+                }
+                QMenuBar::item:selected {
+                    background-color: #d0d0d0;
+                }
+                QMenu {
+                    background-color: #f0f0f0;
+                    color: #000000;
+                }
+                QMenu::item:selected {
+                    background-color: #d0d0d0;
+                }
+                QRadioButton {
+                    color: #000000;
+                }
+                QRadioButton::indicator {
+                    border: 1px solid #cccccc;
+                    border-radius: 7px;
+                }
+                QRadioButton::indicator:checked {
+                    background-color: #0078d4;
+                }
+            """)
+
+    def connect_signals(self):
+        # Connect radio buttons
+        self.solid_color_radio.toggled.connect(self.update_color_mode)
+        self.gradient_color_radio.toggled.connect(self.update_color_mode)
+        
+        # Connect color buttons
+        self.color_button.clicked.connect(self.choose_color)
+        self.gradient_color1_button.clicked.connect(lambda: self.choose_gradient_color(1))
+        self.gradient_color2_button.clicked.connect(lambda: self.choose_gradient_color(2))
+        
+        # Connect preview and export buttons
+        self.preview_button.clicked.connect(self.update_preview)
+        self.export_button.clicked.connect(self.export_animation)
+        self.open_folder_button.clicked.connect(lambda: self.open_export_folder(False))
+        self.browse_button.clicked.connect(lambda: self.browse_export_path(False))
+        
+        # Connect text, mode and font size changes to the live preview
+        self.text_input.textChanged.connect(lambda: self.schedule_preview('text'))
+        self.latex_mode.toggled.connect(lambda: self.schedule_preview('text'))
+        self.font_size.valueChanged.connect(lambda: self.schedule_preview('text'))
+
+        # Animation settings only show in the animated preview
+        for combo in (self.fade_in_method, self.fade_out_method, self.quality_combo):
+            combo.currentTextChanged.connect(lambda: self.animation_settings_changed('text'))
+        for spinbox in (self.fade_in_duration, self.wait_duration, self.fade_out_duration):
+            spinbox.valueChanged.connect(lambda: self.animation_settings_changed('text'))
+
+    def browse_svg_file(self):
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select SVG File",
+            "",
+            "SVG Files (*.svg);;All Files (*.*)"
+        )
+        if file_name:
+            self.svg_path.setText(file_name)
+            self.update_svg_preview()
+
+    def update_svg_preview(self):
+        self.preview_timer.stop()
+        self.preview_generation += 1
+        self.last_preview_source = 'svg'
+        self.reset_timeline()
+        if not self.svg_path.text():
+            self.render_thread.drop_previews(self.preview_generation)
+            self.preview_image.setText("Please select an SVG file")
+            return
+
+        self.show_quick_svg_preview()
+        self.request_preview(self.snapshot_svg_job())
+
+    def show_quick_svg_preview(self):
+        """Draw the SVG with Qt at once; the manim frame replaces it when it is rendered"""
+        path = self.svg_path.text()
+        if not path:
+            return
+        key = (path, render_cache.file_mtime(path))
+        if key != self.quick_svg_key:
+            self.quick_svg_renderer = QSvgRenderer(path)
+            self.quick_svg_key = key
+        if not self.quick_svg_renderer.isValid():
+            return
+
+        # Frames rendered for earlier settings must not replace this one
+        self.preview_generation += 1
+        self.render_thread.drop_previews(self.preview_generation)
+
+        # Lay the SVG out like the manim scene: a 16:9 frame fitted into the
+        # label, with the SVG centred at its scaled manim height
+        ratio = self.preview_image.devicePixelRatioF()
+        size = self.preview_image.size()
+        frame_height = min(size.height(), size.width() * 9 / 16) * ratio
+        frame_width = frame_height * 16 / 9
+        if frame_height < 1:
+            return
+        view_box = self.quick_svg_renderer.viewBoxF()
+        aspect = view_box.width() / view_box.height() if view_box.height() else 1
+        svg_height = frame_height * SVG_MOBJECT_HEIGHT * self.scale_factor.value() / MANIM_FRAME_HEIGHT
+        svg_width = svg_height * aspect
+
+        image = QImage(round(frame_width), round(frame_height), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.black)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.quick_svg_renderer.render(painter, QRectF(
+            (frame_width - svg_width) / 2, (frame_height - svg_height) / 2, svg_width, svg_height
+        ))
+        painter.end()
+        self.show_preview_pixmap(QPixmap.fromImage(image))
+
+    def export_svg_animation(self):
+        if not self.svg_path.text():
+            QMessageBox.warning(self, "Error", "Please select an SVG file first!")
+            return
+            
+        if not self.svg_project_name.text():
+            QMessageBox.warning(self, "Error", "Please enter a project name!")
+            return
+            
+        if not self.svg_export_path.text():
+            QMessageBox.warning(self, "Error", "Please select an export path first!")
+            return
+            
+        if not self.checked_formats(self.svg_format_checks):
+            QMessageBox.warning(self, "Error", "Please select at least one export format!")
+            return
+
+        if "mp4" not in self.checked_formats(self.svg_format_checks) and any(
+                check.isChecked() for check in self.svg_ladder_checks.values()):
+            QMessageBox.warning(self, "Error", "Resolutions are MP4 sizes, please tick MP4 too!")
+            return
+            
+        self.submit_render('export', self.snapshot_svg_job())
+
+def main():
+    app = QApplication(sys.argv)
+    window = ManimUI()
+    window.show()
+    return app.exec()
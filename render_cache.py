@@ -0,0 +1,308 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+
+def user_cache_dir():
+    """Return the per-user cache directory for ManimUI.
+
+    MANIMUI_CACHE_DIR overrides it, e.g. to benchmark with empty caches.
+    """
+    if os.environ.get("MANIMUI_CACHE_DIR"):
+        return os.environ["MANIMUI_CACHE_DIR"]
+    if sys.platform == 'darwin':  # macOS
+        base = os.path.expanduser("~/Library/Caches")
+    elif sys.platform == 'win32':  # Windows
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+    else:  # Linux
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, "ManimUI")
+
+
+# Full-size preview frames, written by the render process and read by the editor
+PREVIEW_DISK_DIR = os.path.join(user_cache_dir(), "previews")
+PREVIEW_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+
+def hash_fields(fields):
+    """Hash a JSON-serialisable dict into a stable hex digest"""
+    data = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_file(src_path, dst_path):
+    """Hard-link src_path to dst_path, or copy it where links don't work.
+
+    The link or copy is made under a temporary name and renamed over
+    dst_path, so a file that is already there is replaced atomically.
+    """
+    directory = os.path.dirname(os.path.abspath(dst_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    os.remove(tmp_path)
+    try:
+        try:
+            os.link(src_path, tmp_path)
+        except OSError:
+            # Other file systems, or ones without hard links
+            shutil.copy2(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def preview_key(job):
+    """Hash everything in a job that affects how its preview looks"""
+    if job['source'] == 'svg':
+        fields = {
+            'source': 'svg',
+            'svg_path': os.path.abspath(job['svg_path']),
+            'mtime': file_mtime(job['svg_path']),
+            'scale': job['scale']
+        }
+    else:
+        fields = {
+            'source': 'text',
+            'content': job['content'],
+            'latex': job['latex'],
+            'font_size': job['font_size'],
+            'colors': job['gradient_colors'] if job['gradient'] else job['color']
+        }
+    fields['size'] = job.get('preview_size')
+    return hash_fields(fields)
+
+
+def export_key(job, **context):
+    """Hash everything in a job that affects its exported files.
+
+    The output name and folder are left out, so the same animation
+    exported under another name or into another folder still matches.
+    SVGs are hashed by content. context adds settings that come from
+    outside the job, such as the frame rate and the manim version.
+    """
+    fields = {
+        'source': job['source'],
+        'fade_in': job['fade_in'],
+        'fade_in_duration': job['fade_in_duration'],
+        'wait_duration': job['wait_duration'],
+        'fade_out': job['fade_out'],
+        'fade_out_duration': job['fade_out_duration'],
+        'quality': job['quality'],
+        'formats': job['formats'],
+        'ladder': job['ladder']
+    }
+    if job['source'] == 'svg':
+        fields['svg'] = file_hash(job['svg_path'])
+        fields['scale'] = job['scale']
+    else:
+        fields.update(
+            content=job['content'],
+            latex=job['latex'],
+            font_size=job['font_size'],
+            gradient=job['gradient'],
+            colors=job['gradient_colors'] if job['gradient'] else job['color']
+        )
+    fields.update(context)
+    return hash_fields(fields)
+
+
+def prune_directory(directory, max_bytes):
+    """Remove least recently used files until a directory fits max_bytes.
+
+    A file's last use is the later of its access and modification times,
+    so both cache hits that touch a file and plain reads keep it alive.
+    """
+    files = []
+    total = 0
+    for entry in os.scandir(directory):
+        if entry.is_file() and not entry.name.endswith(".tmp"):
+            stat = entry.stat()
+            files.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+            total += stat.st_size
+    files.sort()
+    for _, size, path in files:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+class LRUCache:
+    """In-memory LRU cache bounded by the total size of its values"""
+
+    def __init__(self, max_bytes, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        return self.entries[key][0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        # Values larger than the whole budget are simply not cached
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+
+class DiskCache:
+    """Directory of cached files with a size cap and LRU eviction.
+
+    The modification time of each file doubles as its last-use time, so
+    hits touch the file and eviction removes the oldest files first.
+    Writes go through a temporary file and an atomic rename, which keeps
+    the cache consistent when several processes share it.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key, suffix=""):
+        return os.path.join(self.directory, key + suffix)
+
+    def get(self, key, suffix=""):
+        """Return the path of a cached file, or None on a miss"""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put_bytes(self, key, data, suffix=""):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return self.put_file(key, tmp_path, suffix)
+
+    def put_file(self, key, src_path, suffix=""):
+        """Move a finished file into the cache and return its cached path"""
+        path = self.path(key, suffix)
+        os.replace(src_path, path)
+        self.prune()
+        return path
+
+    def prune(self):
+        """Remove least recently used files until the cache fits its cap"""
+        prune_directory(self.directory, self.max_bytes)
+
+
+class ExportCache(DiskCache):
+    """Finished export files keyed by export_key.
+
+    The files of one export are stored as the key plus the suffix each
+    one adds to the output name, e.g. ".mp4" or "_720p.mp4", and are
+    hard-linked into and out of the cache where the file system allows.
+    """
+
+    def fetch(self, key, suffixes, output_path):
+        """Place the cached files at output_path plus each suffix.
+
+        Returns the placed paths, or None unless every file is cached.
+        """
+        cached_paths = [self.get(key, suffix) for suffix in suffixes]
+        if None in cached_paths:
+            return None
+        final_paths = []
+        for cached_path, suffix in zip(cached_paths, suffixes):
+            link_file(cached_path, output_path + suffix)
+            final_paths.append(output_path + suffix)
+        return final_paths
+
+    def store(self, key, output_path, final_paths):
+        """Keep copies of the exported files, named by their suffixes"""
+        for path in final_paths:
+            link_file(path, self.path(key, path[len(output_path):]))
+        self.prune()
+
+
+def save_preview_frame(key, frame):
+    """Write a full-size preview frame to the disk tier of PreviewCache.
+
+    This runs in the render process, right after the frame is drawn, so
+    the editor never waits for the write.
+    """
+    try:
+        disk = DiskCache(PREVIEW_DISK_DIR, PREVIEW_DISK_MAX_BYTES)
+        fd, tmp_path = tempfile.mkstemp(dir=disk.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, frame)
+        disk.put_file(key, tmp_path, ".npy")
+    except OSError:
+        pass
+
+
+class PreviewCache:
+    """Preview frames keyed by preview_key, in memory with an optional disk tier.
+
+    Only the render process writes the disk tier (see save_preview_frame).
+    """
+
+    def __init__(self, max_bytes, disk_dir=None, disk_max_bytes=0):
+        self.memory = LRUCache(max_bytes, sizeof=lambda frame: frame.nbytes)
+        self.disk = DiskCache(disk_dir, disk_max_bytes) if disk_dir else None
+
+    def get(self, key):
+        frame = self.memory.get(key)
+        if frame is None and self.disk is not None:
+            path = self.disk.get(key, ".npy")
+            if path is not None:
+                try:
+                    frame = np.load(path)
+                except (OSError, ValueError):
+                    return None
+                self.memory.put(key, frame)
+        return frame
+
+    def put(self, key, frame):
+        self.memory.put(key, frame)
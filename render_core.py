@@ -0,0 +1,1358 @@
+import os
+import re
+import math
+import itertools
+import hashlib
+import shutil
+import tempfile
+import subprocess
+import time
+import multiprocessing
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from manim import *
+from manim import __version__ as manim_version
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.mobject.svg.svg_mobject import VMobjectFromSVGPath
+from manim.utils.tex_file_writing import tex_to_svg_file
+from PIL import Image
+
+import render_cache
+from render_options import (TEXT_ANIMATIONS_IN, TEXT_ANIMATIONS_OUT, SVG_ANIMATIONS_IN,
+                            SVG_ANIMATIONS_OUT, ANIMATION_TABLES, RESOLUTION_LADDER)
+from render_timing import timed, run_timed
+from render_worker import RenderCancelled
+
+# Media directory used for preview renders. Compiled text lives here
+# across previews and sessions; everything else a preview writes goes
+# to a scratch directory that is removed afterwards.
+MEDIA_DIR = os.path.join(os.getcwd(), "media")
+TEXT_DIR = os.path.join(MEDIA_DIR, "texts")
+SCRATCH_DIR = os.path.join(MEDIA_DIR, "scratch")
+
+# Compiled LaTeX, shared by previews, exports and every ManimUI process
+TEX_CACHE_DIR = os.path.join(render_cache.user_cache_dir(), "tex")
+TEX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Parsed SVG geometry, on disk by content hash and in memory by path and mtime
+SVG_CACHE_DIR = os.path.join(render_cache.user_cache_dir(), "svg")
+SVG_CACHE_MAX_BYTES = 512 * 1024 * 1024
+svg_geometry_memory = render_cache.LRUCache(
+    128 * 1024 * 1024,
+    sizeof=lambda parts: sum(part.points.nbytes for part in parts)
+)
+
+# Finished exports by a hash of everything that affects them
+EXPORT_CACHE_DIR = os.path.join(render_cache.user_cache_dir(), "exports")
+EXPORT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Retention policy for the compiled text cache
+MEDIA_MAX_BYTES = 512 * 1024 * 1024
+MEDIA_PRUNE_INTERVAL = 60
+last_media_prune = 0
+
+# Shortest time slice worth starting a render process for, in seconds
+MIN_SLICE_SECONDS = 2
+# How long cancelled slices get to stop their ffmpeg before they are killed
+SLICE_CANCEL_TIMEOUT = 5
+
+# Set in slice processes to the event that cancels their export
+slice_cancel_event = None
+
+# GIF frame delays are in hundredths of a second, so faster GIFs play slow
+GIF_MAX_FPS = 50
+
+# Frame size and rate of the animated preview timeline
+TIMELINE_SIZE = (480, 270)
+TIMELINE_FPS = 10
+
+
+def spiral(t):
+    """Rate function used by the spiral SVG animations"""
+    angle = 2 * PI * t
+    return np.array([
+        np.cos(angle) * t,
+        np.sin(angle) * t,
+        0
+    ])
+
+
+def spiral_in(mobject):
+    return Create(mobject, rate_func=spiral)
+
+
+def spiral_out(mobject):
+    return Uncreate(mobject, rate_func=spiral)
+
+
+def smooth_create(mobject):
+    return Create(mobject, rate_func=lambda t: smooth(t))
+
+
+def smooth_uncreate(mobject):
+    return Uncreate(mobject, rate_func=lambda t: smooth(t))
+
+
+def show_decreasing_subsets(mobject):
+    return ShowIncreasingSubsets(mobject, rate_func=lambda t: 1-smooth(t))
+
+
+def preview_config(scratch_dir, size=None):
+    """Manim configuration for a preview render.
+
+    Frames are taken straight from the renderer, so only the compiled
+    text and LaTeX caches are written to the shared media directory;
+    anything else Manim creates goes to the preview's own scratch area.
+    size, a (width, height) pair in pixels, overrides the frame size so
+    previews render at the size they are shown at.
+    """
+    preview = {
+        'preview': False,
+        'write_to_movie': False,
+        'save_last_frame': False,
+        'media_dir': MEDIA_DIR,
+        'text_dir': TEXT_DIR,
+        'images_dir': os.path.join(scratch_dir, "images"),
+        'video_dir': os.path.join(scratch_dir, "videos"),
+        'partial_movie_dir': os.path.join(scratch_dir, "partial_movie_files")
+    }
+    if size is not None:
+        preview['pixel_width'], preview['pixel_height'] = size
+    return preview
+
+
+def timeline_config(scratch_dir):
+    """Manim configuration for the small, low frame rate timeline preview"""
+    timeline = preview_config(scratch_dir, TIMELINE_SIZE)
+    timeline['frame_rate'] = TIMELINE_FPS
+    return timeline
+
+
+def export_config(job, work_dir):
+    """Manim configuration for a video export of a job into work_dir.
+
+    With a resolution ladder, frames are rendered at the height of its
+    highest rung and the quality only sets the frame rate.
+    """
+    export = {
+        'preview': False,
+        'write_to_movie': True,
+        'save_last_frame': False,
+        'output_file': job['output_file'],
+        'media_dir': work_dir,
+        'text_dir': TEXT_DIR,
+        'images_dir': os.path.join(work_dir, "images"),
+        'video_dir': os.path.join(work_dir, "videos"),
+        'partial_movie_dir': os.path.join(work_dir, "partial_movie_files"),
+        'quality': job['quality']
+    }
+    if job.get('ladder'):
+        height = max(RESOLUTION_LADDER[rung][0] for rung in job['ladder'])
+        export['pixel_height'] = height
+        export['pixel_width'] = round(height * 16 / 9 / 2) * 2
+    return export
+
+
+def prune_media(force=False):
+    """Keep the shared text cache under MEDIA_MAX_BYTES"""
+    global last_media_prune
+    now = time.time()
+    if not force and now - last_media_prune < MEDIA_PRUNE_INTERVAL:
+        return
+    last_media_prune = now
+    if os.path.isdir(TEXT_DIR):
+        render_cache.prune_directory(TEXT_DIR, MEDIA_MAX_BYTES)
+
+
+def normalize_tex(expression):
+    """Strip the whitespace differences that don't change how TeX typesets"""
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in expression.strip().splitlines()]
+    return "\n".join(lines)
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Version of manim's tex_to_svg_file backed by the persistent TEX_CACHE_DIR.
+
+    The cache key is the complete TeX document, so the template is part of
+    it. Each miss compiles in its own build directory and the SVG is
+    renamed into place atomically, so concurrent processes never see a
+    half-written file.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expression = normalize_tex(expression)
+    if environment is not None:
+        source = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        source = tex_template.get_texcode_for_expression(expression)
+    key = render_cache.hash_fields({
+        'source': source,
+        'compiler': tex_template.tex_compiler,
+        'output_format': tex_template.output_format
+    })
+
+    cache = render_cache.DiskCache(TEX_CACHE_DIR, TEX_CACHE_MAX_BYTES)
+    path = cache.get(key, ".svg")
+    if path is None:
+        build_dir = tempfile.mkdtemp(prefix="build_", dir=TEX_CACHE_DIR)
+        try:
+            with tempconfig({'tex_dir': build_dir}), timed('latex'):
+                svg_file = tex_to_svg_file(expression, environment, tex_template)
+            path = cache.put_file(key, str(svg_file), ".svg")
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    return Path(path)
+
+
+# MathTex looks tex_to_svg_file up in its own module, so route it through the cache
+tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+
+def cached_text2svg(text, color):
+    """Version of Text._text2svg that shares TEXT_DIR safely between processes.
+
+    Hits touch the file, so the pruning in another process leaves it
+    alone. A miss is drawn by Pango in a build directory of its own and
+    renamed into place atomically, so no process ever reads a
+    half-written file.
+    """
+    cache = render_cache.DiskCache(TEXT_DIR, MEDIA_MAX_BYTES)
+    key = text._text2hash(color)
+    path = cache.get(key, ".svg")
+    if path is None:
+        build_dir = tempfile.mkdtemp(prefix="build_", dir=TEXT_DIR)
+        try:
+            with tempconfig({'text_dir': build_dir}):
+                svg_file = manim_text2svg(text, color)
+            path = cache.put_file(key, str(svg_file), ".svg")
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    return path
+
+
+manim_text2svg = Text._text2svg
+Text._text2svg = cached_text2svg
+
+
+# Per-part arrays stored for a parsed SVG and the width of each row
+SVG_GEOMETRY_ARRAYS = {
+    'points': 3,
+    'fill_rgbas': 4,
+    'stroke_rgbas': 4,
+    'background_stroke_rgbas': 4
+}
+
+
+# Only SVGs made of a flat list of plain paths are cached. Shapes such as
+# Rectangle or Line carry their type and attributes of their own, and
+# groups their hierarchy, which the points and style arrays don't keep,
+# so SVGs with those are parsed every time.
+PLAIN_SVG_PART_TYPES = (VMobject, VMobjectFromSVGPath)
+
+
+def svg_geometry_arrays(parts):
+    """The points and style arrays of parsed SVG parts, by name"""
+    arrays = {}
+    for name, width in SVG_GEOMETRY_ARRAYS.items():
+        values = [np.asarray(getattr(part, name), dtype=float).reshape(-1, width) for part in parts]
+        arrays[name] = np.concatenate(values) if values else np.zeros((0, width))
+        arrays[name + '_counts'] = np.array([len(v) for v in values], dtype=np.int64)
+    arrays['stroke_width'] = np.array([part.stroke_width for part in parts], dtype=float)
+    arrays['background_stroke_width'] = np.array(
+        [part.background_stroke_width for part in parts], dtype=float
+    )
+    return arrays
+
+
+def svg_parts_from_arrays(arrays):
+    """Rebuild SVG parts as plain VMobjects from svg_geometry_arrays"""
+    split = {
+        name: np.split(arrays[name], np.cumsum(arrays[name + '_counts'])[:-1])
+        for name in SVG_GEOMETRY_ARRAYS
+    }
+    stroke_width = arrays['stroke_width']
+    background_stroke_width = arrays['background_stroke_width']
+
+    parts = []
+    for i in range(len(stroke_width)):
+        part = VMobject()
+        part.set_points(split['points'][i])
+        part.fill_rgbas = split['fill_rgbas'][i]
+        part.stroke_rgbas = split['stroke_rgbas'][i]
+        part.background_stroke_rgbas = split['background_stroke_rgbas'][i]
+        part.stroke_width = float(stroke_width[i])
+        part.background_stroke_width = float(background_stroke_width[i])
+        parts.append(part)
+    return parts
+
+
+def load_svg_geometry(path):
+    """Rebuild parsed SVG parts from an .npz of svg_geometry_arrays"""
+    with np.load(path) as data:
+        return svg_parts_from_arrays({name: data[name] for name in data.files})
+
+
+class CachedSVGMobject(SVGMobject):
+    """SVGMobject that parses each SVG once.
+
+    Parsed parts are kept in memory keyed by path, mtime and size, and on
+    disk keyed by a hash of the file contents, so only the first load of a
+    file pays for XML parsing and path conversion. Scaling and positioning
+    are applied afterwards as usual.
+
+    Cached parts are plain VMobjects, and the first load builds the same
+    plain VMobjects, so a cold render and a cached one draw identical
+    objects. SVGs with parts of other types are not cached.
+    """
+
+    def init_svg_mobject(self, use_svg_cache):
+        file_path = self.get_file_path()
+        stat = os.stat(file_path)
+        style = repr((self.svg_default, self.path_string_config))
+        memory_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, style)
+
+        parts = svg_geometry_memory.get(memory_key)
+        if parts is None:
+            with open(file_path, "rb") as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+            disk_key = render_cache.hash_fields({'content': content_hash, 'style': style})
+            disk = render_cache.DiskCache(SVG_CACHE_DIR, SVG_CACHE_MAX_BYTES)
+            cached_path = disk.get(disk_key, ".npz")
+            if cached_path is not None:
+                parts = load_svg_geometry(cached_path)
+            else:
+                self.generate_mobject()
+                parsed = self.submobjects
+                if not all(type(part) in PLAIN_SVG_PART_TYPES and not part.submobjects
+                           for part in parsed):
+                    return
+                arrays = svg_geometry_arrays(parsed)
+                fd, tmp_path = tempfile.mkstemp(dir=SVG_CACHE_DIR, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **arrays)
+                disk.put_file(disk_key, tmp_path, ".npz")
+                parts = svg_parts_from_arrays(arrays)
+                self.remove(*self.submobjects)
+            svg_geometry_memory.put(memory_key, parts)
+
+        self.add(*[part.copy() for part in parts])
+
+
+def build_text(job):
+    """Build the Text or MathTex mobject described by a text job"""
+    content = job['content']
+
+    if job['latex']:
+        text = MathTex(content)
+        # Apply colors to LaTeX text
+        if job['gradient']:
+            text.set_color_by_gradient(*job['gradient_colors'])
+        else:
+            text.set_color(job['color'])
+        # Scale LaTeX text
+        text.scale(job['font_size'] / 48)
+    else:
+        if job['gradient']:
+            text = Text(
+                content,
+                font_size=job['font_size'],
+                gradient=tuple(job['gradient_colors'])
+            )
+        else:
+            text = Text(
+                content,
+                font_size=job['font_size'],
+                color=job['color']
+            )
+    return text
+
+
+def build_svg(job):
+    """Build the SVGMobject described by an SVG job"""
+    svg = CachedSVGMobject(job['svg_path'])
+    svg.scale(job['scale'])
+    svg.move_to(ORIGIN)
+    return svg
+
+
+class ExportMonitor:
+    """Follows the frames written during an export.
+
+    Reports progress at most every REPORT_INTERVAL seconds and stops the
+    render by raising RenderCancelled once is_cancelled returns True.
+    """
+
+    REPORT_INTERVAL = 0.1
+
+    def __init__(self, total_frames, animation_names, report=None, is_cancelled=None):
+        self.total_frames = total_frames
+        self.animation_names = animation_names
+        self.report = report
+        self.is_cancelled = is_cancelled
+        self.frames = 0
+        self.animation = -1
+        self.start_time = time.time()
+        self.last_report = 0
+
+    def next_animation(self):
+        self.animation += 1
+
+    def info(self):
+        elapsed = time.time() - self.start_time
+        remaining = max(self.total_frames - self.frames, 0)
+        index = min(max(self.animation, 0), len(self.animation_names) - 1)
+        return {
+            'frames': min(self.frames, self.total_frames),
+            'total_frames': self.total_frames,
+            'animation': self.animation_names[index],
+            'elapsed': elapsed,
+            'eta': elapsed / self.frames * remaining if self.frames else None
+        }
+
+    def frame_written(self, file_writer, count=1):
+        self.frames += count
+        if self.is_cancelled is not None and self.is_cancelled():
+            file_writer.abort()
+            raise RenderCancelled("Export cancelled")
+        now = time.time()
+        if self.report is not None and now - self.last_report >= self.REPORT_INTERVAL:
+            self.last_report = now
+            self.report(self.info())
+
+
+def is_reencoded(formats, ladder=None):
+    """Whether an export is encoded again into other formats or sizes after rendering"""
+    return bool(ladder) or any(export_format != "mp4" for export_format in formats)
+
+
+def movie_encoder_args(lossless=False):
+    """ffmpeg codec settings of the movie files an export is joined from.
+
+    These are manim's own yuv420p H.264 settings, or lossless RGB H.264
+    for an export that encode_formats encodes again, so that the final
+    encodes start from the frames exactly as they were drawn.
+    """
+    if lossless:
+        return ["-vcodec", "libx264rgb", "-crf", "0", "-preset", "ultrafast", "-pix_fmt", "rgb24"]
+    return ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+
+
+def encode_held_frame(frame, num_frames, movie_file, clip_seconds=1, lossless=False,
+                      is_cancelled=None):
+    """Encode num_frames copies of one frame into movie_file.
+
+    A still clip of clip_seconds is encoded once and joined to itself
+    with the concat demuxer, so the cost barely depends on num_frames.
+    The input and codec settings match the export's other partial movie
+    files (see movie_encoder_args), so the result can be joined with
+    them by stream copy. Once is_cancelled returns True, ffmpeg is
+    stopped and RenderCancelled is raised.
+    """
+    if num_frames <= 0:
+        raise ValueError(f"Cannot encode {num_frames} frames")
+    height, width = frame.shape[:2]
+    fps = config.frame_rate
+    clip_frames = min(num_frames, int(round(fps * clip_seconds)))
+    repeats, remainder = divmod(num_frames, clip_frames)
+
+    base = os.path.splitext(movie_file)[0]
+    still_file = base + "_still.rgba"
+    with open(still_file, "wb") as f:
+        f.write(np.ascontiguousarray(frame).tobytes())
+
+    def encode_still(frames, path):
+        run_ffmpeg([
+            config.ffmpeg_executable, "-y",
+            "-f", "rawvideo", "-s", f"{width}x{height}", "-pix_fmt", "rgba",
+            "-r", str(fps), "-stream_loop", "-1", "-i", still_file,
+            "-frames:v", str(frames), "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower()
+        ] + movie_encoder_args(lossless) + [path], is_cancelled)
+
+    clip_file = base + "_still.mp4"
+    remainder_file = base + "_still_rest.mp4"
+    try:
+        if repeats == 1 and not remainder:
+            encode_still(num_frames, movie_file)
+        else:
+            encode_still(clip_frames, clip_file)
+            clips = [clip_file] * repeats
+            if remainder:
+                encode_still(remainder, remainder_file)
+                clips.append(remainder_file)
+            concat_movies(clips, movie_file, is_cancelled)
+    finally:
+        for path in (still_file, clip_file, remainder_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def run_ffmpeg(command, is_cancelled=None):
+    """Run an ffmpeg command and wait for it to finish.
+
+    Once is_cancelled returns True, ffmpeg is stopped and RenderCancelled
+    is raised; a failed command raises CalledProcessError.
+    """
+    process = subprocess.Popen(command)
+    while True:
+        try:
+            returncode = process.wait(ExportMonitor.REPORT_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            if is_cancelled is not None and is_cancelled():
+                process.terminate()
+                process.wait()
+                raise RenderCancelled("Export cancelled")
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command)
+
+
+def concat_movies(movie_files, output_file, is_cancelled=None):
+    """Join movie files with the concat demuxer, without re-encoding"""
+    list_file = os.path.splitext(output_file)[0] + "_concat.txt"
+    with open(list_file, "w", encoding="utf-8") as f:
+        for path in movie_files:
+            f.write(f"file '{Path(path).as_posix()}'\n")
+    try:
+        run_ffmpeg([
+            config.ffmpeg_executable, "-y",
+            "-f", "concat", "-safe", "0", "-i", list_file,
+            "-loglevel", config.ffmpeg_loglevel.lower(),
+            "-c", "copy", output_file
+        ], is_cancelled)
+    finally:
+        os.remove(list_file)
+
+
+class ExportFileWriter(SceneFileWriter):
+    """SceneFileWriter that tells an ExportMonitor about every frame.
+
+    Held frames, such as a wait with nothing moving, are not piped to the
+    encoder frame by frame but go through encode_held_frame. With
+    lossless set, partial movie files are lossless (see movie_encoder_args).
+    """
+
+    def __init__(self, renderer, scene_name, monitor=None, lossless=False, **kwargs):
+        self.monitor = monitor
+        self.lossless = lossless
+        self.movie_file = None
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.movie_file = file_path
+        if not self.lossless:
+            super().open_movie_pipe(file_path)
+            return
+
+        # manim's own movie pipe, with the lossless codec settings
+        self.partial_movie_file_path = file_path
+        fps = config.frame_rate
+        if fps == int(fps):
+            fps = int(fps)
+        self.writing_process = subprocess.Popen([
+            config.ffmpeg_executable, "-y",
+            "-f", "rawvideo", "-s", f"{config.pixel_width}x{config.pixel_height}",
+            "-pix_fmt", "rgba", "-r", str(fps), "-i", "-", "-an",
+            "-loglevel", config.ffmpeg_loglevel.lower()
+        ] + movie_encoder_args(True) + [file_path], stdin=subprocess.PIPE)
+
+    def close_movie_pipe(self):
+        super().close_movie_pipe()
+        self.movie_file = None
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        super().begin_animation(allow_write, file_path)
+        if self.monitor is not None:
+            self.monitor.next_animation()
+
+    def write_frame(self, frame_or_renderer):
+        with timed('encode'):
+            super().write_frame(frame_or_renderer)
+        if self.monitor is not None:
+            self.monitor.frame_written(self)
+
+    def write_held_frame(self, frame, num_frames):
+        """Write the same frame num_frames times without encoding each copy"""
+        if self.movie_file is None:
+            for _ in range(num_frames):
+                self.write_frame(frame)
+            return
+
+        # The encoder opened for this animation is not needed
+        self.abort()
+        with timed('encode'):
+            encode_held_frame(
+                frame, num_frames, self.movie_file, lossless=self.lossless,
+                is_cancelled=self.is_cancelled()
+            )
+        if self.monitor is not None:
+            self.monitor.frame_written(self, num_frames)
+
+    def finish(self):
+        with timed('encode'):
+            super().finish()
+
+    def is_cancelled(self):
+        """The monitor's is_cancelled, for ffmpeg runs of the file writer's own"""
+        return self.monitor.is_cancelled if self.monitor is not None else None
+
+    def abort(self):
+        """Kill the encoder of the current partial movie file"""
+        if hasattr(self, "writing_process"):
+            self.writing_process.kill()
+            self.writing_process.wait()
+
+
+class SliceFileWriter(ExportFileWriter):
+    """File writer for one time slice of a segmented export.
+
+    Instead of a partial movie file per animation, every frame the slice
+    renders goes into a single slice_file. Held frames are encoded on
+    their own and joined with the piped frames by stream copy.
+    """
+
+    def __init__(self, renderer, scene_name, slice_file, monitor=None, lossless=False, **kwargs):
+        self.slice_file = slice_file
+        self.pieces = []
+        super().__init__(renderer, scene_name, monitor=monitor, lossless=lossless, **kwargs)
+
+    def next_piece(self):
+        path = os.path.splitext(self.slice_file)[0] + f"_{len(self.pieces):03d}.mp4"
+        self.pieces.append(path)
+        return path
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if self.monitor is not None:
+            self.monitor.next_animation()
+
+    def end_animation(self, allow_write=False):
+        pass
+
+    def write_frame(self, frame_or_renderer):
+        if self.movie_file is None:
+            self.open_movie_pipe(self.next_piece())
+        super().write_frame(frame_or_renderer)
+
+    def write_held_frame(self, frame, num_frames):
+        if self.movie_file is not None:
+            self.close_movie_pipe()
+        encode_held_frame(
+            frame, num_frames, self.next_piece(), lossless=self.lossless,
+            is_cancelled=self.is_cancelled()
+        )
+        if self.monitor is not None:
+            self.monitor.frame_written(self, num_frames)
+
+    def finish(self):
+        if self.movie_file is not None:
+            self.close_movie_pipe()
+        if len(self.pieces) == 1:
+            os.replace(self.pieces[0], self.slice_file)
+        elif self.pieces:
+            concat_movies(self.pieces, self.slice_file, self.is_cancelled())
+
+
+class TimelineFileWriter(SceneFileWriter):
+    """SceneFileWriter that hands frames to a callback instead of a movie.
+
+    report is called with each frame as soon as it is drawn, its index,
+    how many frames it is held for, and the length and frame rate of the
+    whole timeline. Once is_cancelled returns True, RenderCancelled is
+    raised at the next frame.
+    """
+
+    def __init__(self, renderer, scene_name, total_frames, report=None, is_cancelled=None, **kwargs):
+        self.total_frames = total_frames
+        self.report = report
+        self.is_cancelled = is_cancelled
+        self.frames = 0
+        super().__init__(renderer, scene_name, **kwargs)
+
+    def write_frame(self, frame_or_renderer):
+        self.write_held_frame(frame_or_renderer, 1)
+
+    def write_held_frame(self, frame, num_frames):
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise RenderCancelled("Animated preview cancelled")
+        if self.report is not None:
+            self.report({
+                'frame': np.ascontiguousarray(frame),
+                'index': self.frames,
+                'count': num_frames,
+                'total_frames': self.total_frames,
+                'fps': config.frame_rate
+            })
+        self.frames += num_frames
+
+
+class ExportRenderer(CairoRenderer):
+    """CairoRenderer that hands held frames to the file writer in one go.
+
+    Manim freezes the frame for waits where nothing moves and adds it
+    num_frames times; the file writer can encode that without rendering
+    or piping every copy.
+    """
+
+    def add_frame(self, frame, num_frames=1):
+        # A zero length wait adds no frames at all
+        if num_frames <= 1 or self.skip_animations:
+            super().add_frame(frame, num_frames)
+            return
+        self.time += num_frames / self.camera.frame_rate
+        self.file_writer.write_held_frame(frame, num_frames)
+
+
+class SliceRenderer(ExportRenderer):
+    """ExportRenderer that only draws and writes frames inside a window.
+
+    window is a (start, end) pair of frame numbers over the whole scene,
+    end being None for the last slice. Animations still advance through
+    frames outside the window, but those are never drawn by Cairo.
+    """
+
+    def __init__(self, window, **kwargs):
+        self.window = window
+        self.frame_number = 0
+        super().__init__(**kwargs)
+
+    def frames_in_window(self, num_frames):
+        start, end = self.window
+        first = max(self.frame_number, start)
+        last = self.frame_number + num_frames
+        if end is not None:
+            last = min(last, end)
+        return max(last - first, 0)
+
+    def render(self, scene, time, moving_mobjects):
+        if self.frames_in_window(1):
+            super().render(scene, time, moving_mobjects)
+        else:
+            self.frame_number += 1
+            self.time += 1 / self.camera.frame_rate
+
+    def add_frame(self, frame, num_frames=1):
+        if self.skip_animations:
+            super().add_frame(frame, num_frames)
+            return
+        count = self.frames_in_window(num_frames)
+        self.frame_number += num_frames
+        self.time += (num_frames - count) / self.camera.frame_rate
+        if count:
+            super().add_frame(frame, count)
+
+
+class CancellableCamera(Camera):
+    """Camera that stops drawing a frame once is_cancelled returns True.
+
+    A full-size still of a detailed SVG can take a while to draw, so
+    is_cancelled is checked before each mobject and RenderCancelled is
+    raised as soon as it returns True.
+    """
+
+    def __init__(self, is_cancelled=None, **kwargs):
+        self.is_cancelled = is_cancelled
+        super().__init__(**kwargs)
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if self.is_cancelled is None:
+            super().capture_mobjects(mobjects, **kwargs)
+            return
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        # The same drawing Camera.capture_mobjects does, one mobject at a time
+        for group_type, group in itertools.groupby(mobjects, self.type_or_raise):
+            for mobject in group:
+                if self.is_cancelled():
+                    raise RenderCancelled("Render cancelled")
+                self.display_funcs[group_type]([mobject], self.pixel_array)
+
+
+class JobScene(Scene):
+    """Scene that reads everything it needs from a job snapshot.
+
+    file_writer_class, if given, replaces the file writer of an export
+    renderer, e.g. to stream frames to the editor. is_cancelled lets a
+    render stop between building its mobjects, which may mean compiling
+    LaTeX, and drawing them. Stills, which have no frames to stop
+    between, also check it while drawing (see CancellableCamera).
+    """
+
+    def __init__(self, job, monitor=None, window=None, slice_file=None, file_writer_class=None,
+                 is_cancelled=None, **kwargs):
+        self.job = job
+        self.is_cancelled = is_cancelled
+        lossless = is_reencoded(job.get('formats', ()), job.get('ladder'))
+        if file_writer_class is not None:
+            kwargs['renderer'] = ExportRenderer(
+                file_writer_class=file_writer_class,
+                camera_class=kwargs.get('camera_class', Camera)
+            )
+        elif window is not None:
+            kwargs['renderer'] = SliceRenderer(
+                window,
+                file_writer_class=partial(
+                    SliceFileWriter, slice_file=slice_file, monitor=monitor, lossless=lossless
+                ),
+                camera_class=kwargs.get('camera_class', Camera)
+            )
+        elif monitor is not None:
+            kwargs['renderer'] = ExportRenderer(
+                file_writer_class=partial(ExportFileWriter, monitor=monitor, lossless=lossless),
+                camera_class=kwargs.get('camera_class', Camera)
+            )
+        elif is_cancelled is not None:
+            kwargs.setdefault('camera_class', partial(CancellableCamera, is_cancelled=is_cancelled))
+        super().__init__(**kwargs)
+
+    def check_cancelled(self):
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise RenderCancelled("Render cancelled")
+
+
+class TextPreviewScene(JobScene):
+    def construct(self):
+        with timed('build'):
+            text = build_text(self.job)
+        self.check_cancelled()
+        text.move_to(ORIGIN)
+        self.add(text)
+
+
+class SVGPreviewScene(JobScene):
+    def construct(self):
+        with timed('build'):
+            svg = build_svg(self.job)
+        self.check_cancelled()
+        self.add(svg)
+
+
+class TextAnimationScene(JobScene):
+    def construct(self):
+        job = self.job
+        with timed('build'):
+            text = build_text(job)
+        self.check_cancelled()
+
+        # Get selected animation methods
+        fade_in_animation = TEXT_ANIMATIONS_IN[job['fade_in']]
+        fade_out_animation = TEXT_ANIMATIONS_OUT[job['fade_out']]
+
+        # Fade in with selected method
+        self.play(fade_in_animation(text), run_time=job['fade_in_duration'])
+
+        # Wait
+        self.wait(job['wait_duration'])
+
+        # Fade out with selected method
+        self.play(fade_out_animation(text), run_time=job['fade_out_duration'])
+
+
+class SVGAnimationScene(JobScene):
+    def construct(self):
+        job = self.job
+        with timed('build'):
+            svg = build_svg(job)
+        self.check_cancelled()
+
+        anim_in = SVG_ANIMATIONS_IN[job['fade_in']](svg)
+        anim_out = SVG_ANIMATIONS_OUT[job['fade_out']](svg)
+
+        # Animate in
+        self.play(anim_in, run_time=job['fade_in_duration'])
+
+        # Wait
+        self.wait(job['wait_duration'])
+
+        # Animate out
+        self.play(anim_out, run_time=job['fade_out_duration'])
+
+
+class FrameScene(JobScene):
+    """Still scene showing a job's animation as it is at time t.
+
+    Nothing before t is played: the animation running at t is begun and
+    interpolated straight to its alpha, and one that ended before t is
+    jumped to its end, so any frame costs about as much as a preview.
+    """
+
+    def __init__(self, job, t, **kwargs):
+        self.t = t
+        super().__init__(job, **kwargs)
+
+    def construct(self):
+        job = self.job
+        with timed('build'):
+            mobject = BUILDERS[job['source']](job)
+        self.check_cancelled()
+        animations_in, animations_out = ANIMATION_TABLES[job['source']]
+
+        self.show_animation(animations_in[job['fade_in']](mobject), job['fade_in_duration'], self.t)
+        out_start = job['fade_in_duration'] + job['wait_duration']
+        if self.t > out_start:
+            self.show_animation(
+                animations_out[job['fade_out']](mobject), job['fade_out_duration'], self.t - out_start
+            )
+
+    def show_animation(self, animation, run_time, t):
+        """Put animation into the scene as it is t seconds after it starts"""
+        # The same steps Scene.play takes, without the frames in between
+        animation.run_time = run_time
+        self.add_mobjects_from_animations([animation])
+        animation._setup_scene(self)
+        animation.begin()
+        if run_time > 0 and t < run_time:
+            animation.interpolate(max(t, 0) / run_time)
+        else:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+
+
+PREVIEW_SCENES = {'text': TextPreviewScene, 'svg': SVGPreviewScene}
+ANIMATION_SCENES = {'text': TextAnimationScene, 'svg': SVGAnimationScene}
+BUILDERS = {'text': build_text, 'svg': build_svg}
+
+
+def render_still(make_scene, size=None, quality=None):
+    """Render the single frame of a scene without animations as an RGBA array.
+
+    make_scene is called to create the scene once the config is in
+    place. size, a (width, height) pair, or quality sets the frame size.
+    """
+    os.makedirs(SCRATCH_DIR, exist_ok=True)
+    scratch_dir = tempfile.mkdtemp(prefix="preview_", dir=SCRATCH_DIR)
+    still = preview_config(scratch_dir, size)
+    if quality is not None:
+        still['quality'] = quality
+    try:
+        with tempconfig(still):
+            scene = make_scene()
+            with timed('frames'):
+                scene.render()
+
+            # A scene without animations leaves its final frame in the camera
+            frame = np.ascontiguousarray(scene.renderer.camera.pixel_array)
+    finally:
+        with timed('cleanup'):
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    with timed('cleanup'):
+        prune_media()
+    return frame
+
+
+def render_preview(job, is_cancelled=None):
+    """Render the still preview frame of a job and return it as an RGBA array.
+
+    Once is_cancelled returns True the preview stops, before or while it
+    is drawn, and RenderCancelled is raised. With 'save_preview' set, the
+    frame is also written to the editor's disk cache under 'cache_key'.
+    """
+    frame = render_still(
+        partial(PREVIEW_SCENES[job['source']], job, is_cancelled=is_cancelled),
+        job.get('preview_size')
+    )
+    if job.get('save_preview'):
+        with timed('cleanup'):
+            render_cache.save_preview_frame(job['cache_key'], frame)
+    return frame
+
+
+def render_frame(job, t, is_cancelled=None):
+    """Render the frame of a job's animation at t seconds as an RGBA array.
+
+    See FrameScene. The frame is drawn at the job's 'preview_size', or at
+    the size of its quality when it has none.
+    """
+    scene = partial(FrameScene, job, t, is_cancelled=is_cancelled)
+    if job.get('preview_size'):
+        return render_still(scene, job['preview_size'])
+    return render_still(scene, quality=job['quality'])
+
+
+def render_stills(job):
+    """Save the frames of a job at each of its 'times' as PNGs in its export folder.
+
+    Returns the paths of the PNGs, named <output_file>_<t>s.png.
+    """
+    os.makedirs(job['export_dir'], exist_ok=True)
+    paths = []
+    for t in job['times']:
+        frame = render_frame(job, t)
+        path = os.path.join(job['export_dir'], f"{job['output_file']}_{t:g}s.png")
+        with timed('encode'):
+            Image.fromarray(frame).save(path)
+        paths.append(path)
+    return paths
+
+
+def render_timeline(job, progress=None, is_cancelled=None):
+    """Render a job's whole animation as small frames at a low frame rate.
+
+    Each frame goes to progress as soon as it is drawn (see
+    TimelineFileWriter), so the editor can play and scrub the start of
+    the animation while the rest renders. Returns the number of frames.
+    """
+    os.makedirs(SCRATCH_DIR, exist_ok=True)
+    scratch_dir = tempfile.mkdtemp(prefix="timeline_", dir=SCRATCH_DIR)
+    try:
+        with tempconfig(timeline_config(scratch_dir)):
+            total_frames = sum(
+                round(duration * config.frame_rate) for _, duration in export_segments(job)
+            )
+            scene = ANIMATION_SCENES[job['source']](job, file_writer_class=partial(
+                TimelineFileWriter,
+                total_frames=total_frames,
+                report=progress,
+                is_cancelled=is_cancelled
+            ))
+            with timed('frames'):
+                scene.render()
+            return scene.renderer.file_writer.frames
+    finally:
+        with timed('cleanup'):
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def export_file_names(output_file, formats, ladder=None):
+    """Names of the files an export produces, in the order of formats.
+
+    PNG sequences are a folder of frames, and with a resolution ladder
+    the mp4 output becomes one file per rung.
+    """
+    names = []
+    for export_format in formats:
+        if export_format == "png":
+            names.append(f"{output_file}_frames")
+        elif export_format == "mp4" and ladder:
+            names.extend(f"{output_file}_{rung}.mp4" for rung in ladder)
+        else:
+            names.append(f"{output_file}.{export_format}")
+    return names
+
+
+def encode_formats(video_file, formats, ladder=None, is_cancelled=None):
+    """Encode every export format and ladder rung from the rendered video.
+
+    An export that needs this renders video_file losslessly (see
+    movie_encoder_args), so no format is encoded from another lossy
+    encode: PNG frames are exact, and the mp4, each rung and the other
+    formats are encoded once, straight from the drawn frames.
+
+    Everything comes out of one ffmpeg run that decodes the video once
+    and feeds every output, so frames are rasterized and decoded only
+    once however many formats and rungs are wanted. Rungs are split from
+    the same stream, scaled down and encoded at their own bitrate. The
+    outputs are written next to video_file, which is removed. Once
+    is_cancelled returns True, ffmpeg is stopped and RenderCancelled is
+    raised.
+    """
+    if not is_reencoded(formats, ladder):
+        return
+
+    video_dir, video_name = os.path.split(video_file)
+    output_file = os.path.splitext(video_name)[0]
+    # The final mp4 takes the rendered video's name
+    lossless_file = os.path.join(video_dir, f"{output_file}_lossless.mp4")
+    os.replace(video_file, lossless_file)
+    command = [
+        config.ffmpeg_executable, "-y", "-i", lossless_file,
+        "-loglevel", config.ffmpeg_loglevel.lower()
+    ]
+    filters = []
+    if ladder:
+        labels = "".join(f"[rung{i}]" for i in range(len(ladder)))
+        filters.append(f"[0:v]split={len(ladder)}{labels}")
+        for i, rung in enumerate(ladder):
+            filters.append(f"[rung{i}]scale=-2:{RESOLUTION_LADDER[rung][0]}[scaled{i}]")
+    if "gif" in formats:
+        # A palette made for this video keeps the GIF's colours close to the original
+        gif_filter = "[0:v]"
+        if config.frame_rate > GIF_MAX_FPS:
+            gif_filter += f"fps={GIF_MAX_FPS},"
+        gif_filter += "split[frames][palette_in];[palette_in]palettegen=stats_mode=diff[palette];"
+        gif_filter += "[frames][palette]paletteuse=dither=sierra2_4a[gif]"
+        filters.append(gif_filter)
+    if filters:
+        command += ["-filter_complex", ";".join(filters)]
+
+    for i, (rung, bitrate) in enumerate((ladder or {}).items()):
+        path = os.path.join(video_dir, f"{output_file}_{rung}.mp4")
+        command += ["-map", f"[scaled{i}]", "-c:v", "libx264", "-b:v", bitrate,
+                    "-maxrate", bitrate, "-bufsize", bitrate, "-pix_fmt", "yuv420p",
+                    "-movflags", "+faststart", path]
+    for export_format in formats:
+        # With a ladder the rungs above are the mp4 output
+        if export_format == "mp4" and ladder:
+            continue
+        name = export_file_names(output_file, [export_format])[0]
+        path = os.path.join(video_dir, name)
+        if export_format == "mp4":
+            command += ["-map", "0:v"] + movie_encoder_args() + ["-movflags", "+faststart", path]
+        elif export_format == "webm":
+            command += ["-map", "0:v", "-c:v", "libvpx-vp9", "-b:v", "0", "-crf", "32",
+                        "-row-mt", "1", "-pix_fmt", "yuv420p", path]
+        elif export_format == "gif":
+            command += ["-map", "[gif]", path]
+        elif export_format == "png":
+            os.makedirs(path, exist_ok=True)
+            command += ["-map", "0:v", os.path.join(path, f"{output_file}_%05d.png")]
+    run_ffmpeg(command, is_cancelled)
+    os.remove(lossless_file)
+
+
+def cleanup_export_files(work_dir, export_dir, output_file, formats=("mp4",), ladder=None):
+    """Move every exported file into the export folder and remove everything else.
+
+    Returns the exported paths, as named by export_file_names.
+    """
+    video_dir = os.path.join(work_dir, "videos")
+    final_paths = []
+    for name in export_file_names(output_file, formats, ladder):
+        if not os.path.exists(os.path.join(video_dir, name)):
+            raise RuntimeError(f"The export did not produce {name}")
+        final_path = os.path.join(export_dir, name)
+        # A PNG sequence from an earlier export would mix with the new frames
+        if os.path.isdir(final_path):
+            shutil.rmtree(final_path)
+        os.replace(os.path.join(video_dir, name), final_path)
+        final_paths.append(final_path)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return final_paths
+
+
+def export_segments(job):
+    """Names and durations of the in, wait and out parts of an export"""
+    return [
+        (f"Animation In: {job['fade_in']}", job['fade_in_duration']),
+        ("Wait", job['wait_duration']),
+        (f"Animation Out: {job['fade_out']}", job['fade_out_duration'])
+    ]
+
+
+def plan_slices(job, fps, processes):
+    """Split an export into frame windows that can render in parallel.
+
+    The wait is a held frame that costs little, so it gets one window of
+    its own; the animations are cut into windows of similar length at
+    frame boundaries. The last window is open ended, so a frame count
+    that differs slightly from manim's own never loses frames.
+    """
+    if processes <= 1:
+        return [(0, None)]
+
+    in_frames = math.ceil(job['fade_in_duration'] * fps)
+    wait_frames = int(job['wait_duration'] * fps)
+    out_frames = math.ceil(job['fade_out_duration'] * fps)
+    slice_frames = max(
+        math.ceil((in_frames + out_frames) / max(processes - 1, 1)),
+        int(MIN_SLICE_SECONDS * fps)
+    )
+
+    boundaries = {0}
+    for start, frames in ((0, in_frames), (in_frames + wait_frames, out_frames)):
+        count = max(1, round(frames / slice_frames))
+        boundaries.update(start + round(frames * i / count) for i in range(count + 1))
+    boundaries = sorted(boundaries)
+    if len(boundaries) < 2:
+        return [(0, None)]
+    windows = list(zip(boundaries[:-1], boundaries[1:]))
+    windows[-1] = (windows[-1][0], None)
+    return windows
+
+
+def init_slice_process(cancel_event):
+    """Pool initializer: keep the event that cancels this export's slices"""
+    global slice_cancel_event
+    slice_cancel_event = cancel_event
+
+
+def render_slice(job, window, slice_file):
+    """Render one frame window of an export into slice_file.
+
+    Once the export is cancelled, the slice kills its own ffmpeg and
+    raises RenderCancelled, so no encoder outlives the slice process.
+    """
+    is_cancelled = slice_cancel_event.is_set if slice_cancel_event is not None else None
+    if is_cancelled is not None and is_cancelled():
+        raise RenderCancelled("Export cancelled")
+    work_dir = os.path.splitext(slice_file)[0]
+    os.makedirs(work_dir, exist_ok=True)
+    with tempconfig(export_config(job, work_dir)):
+        monitor = ExportMonitor(0, ["Slice"], is_cancelled=is_cancelled)
+        scene = ANIMATION_SCENES[job['source']](
+            job, monitor=monitor, window=window, slice_file=slice_file, is_cancelled=is_cancelled
+        )
+        scene.render()
+
+
+def render_slices(job, windows, work_dir, progress=None, is_cancelled=None):
+    """Render the windows of an export in a pool of processes and join them.
+
+    Every slice is encoded on its own with the same settings, so the
+    slices are joined by stream copy without re-encoding. On cancel, the
+    slices are told to stop their ffmpeg and given SLICE_CANCEL_TIMEOUT
+    seconds to do so before the pool is terminated.
+    """
+    slice_files = [os.path.join(work_dir, f"slice_{i:03d}.mp4") for i in range(len(windows))]
+    total_frames = sum(round(duration * config.frame_rate) for _, duration in export_segments(job))
+    monitor = ExportMonitor(total_frames, [f"Rendering {len(windows)} slices"], report=progress)
+    monitor.next_animation()
+
+    def window_frames(window):
+        start, end = window
+        return (total_frames if end is None else end) - start
+
+    context = multiprocessing.get_context('spawn')
+    cancel_event = context.Event()
+    with context.Pool(
+        min(job['render_processes'], len(windows)),
+        initializer=init_slice_process,
+        initargs=(cancel_event,)
+    ) as pool:
+        results = [
+            pool.apply_async(render_slice, (job, window, path))
+            for window, path in zip(windows, slice_files)
+        ]
+        pending = list(results)
+        while pending:
+            if is_cancelled is not None and is_cancelled():
+                cancel_event.set()
+                deadline = time.time() + SLICE_CANCEL_TIMEOUT
+                for result in pending:
+                    result.wait(max(deadline - time.time(), 0))
+                pool.terminate()
+                raise RenderCancelled("Export cancelled")
+            pending[0].wait(ExportMonitor.REPORT_INTERVAL)
+            pending = [result for result in pending if not result.ready()]
+            done = sum(
+                window_frames(window) for window, result in zip(windows, results)
+                if result.ready()
+            )
+            if progress is not None and done != monitor.frames:
+                monitor.frames = done
+                progress(monitor.info())
+        for result in results:
+            # Raises the error of a slice that failed
+            result.get()
+
+    os.makedirs(config.video_dir, exist_ok=True)
+    with timed('encode'):
+        concat_movies(
+            [path for path in slice_files if os.path.exists(path)],
+            os.path.join(config.video_dir, f"{job['output_file']}.mp4"),
+            is_cancelled
+        )
+
+
+def render_export(job, progress=None, is_cancelled=None):
+    """Render a job to video and return the exported file paths.
+
+    progress is called with frame counts, the current animation and an
+    ETA while frames are written; once is_cancelled returns True, be it
+    while building, rendering or encoding the other formats, the encoder
+    is killed, partial files are removed and RenderCancelled is raised.
+
+    With render_processes above one, the export is cut into time slices
+    that render in separate processes and are joined afterwards. With
+    formats other than mp4 or a resolution ladder, the video is rendered
+    losslessly and every format and rung is encoded from it, so frames
+    are rasterized once for all of them.
+
+    Finished files are kept in the export cache, and an export that
+    matches one there is linked or copied into place without rendering.
+    PNG sequences are folders of frames and are not cached.
+    """
+    output_path = os.path.join(job['export_dir'], job['output_file'])
+    cache = None
+    if "png" not in job['formats']:
+        cache = render_cache.ExportCache(EXPORT_CACHE_DIR, EXPORT_CACHE_MAX_BYTES)
+        with tempconfig(export_config(job, job['export_dir'])):
+            cache_key = render_cache.export_key(
+                job,
+                manim=manim_version,
+                frame_rate=config.frame_rate,
+                frame_size=(config.pixel_width, config.pixel_height)
+            )
+        suffixes = [
+            name[len(job['output_file']):]
+            for name in export_file_names(job['output_file'], job['formats'], job['ladder'])
+        ]
+        os.makedirs(job['export_dir'], exist_ok=True)
+        final_paths = cache.fetch(cache_key, suffixes, output_path)
+        if final_paths is not None:
+            return final_paths
+
+    # Every export renders in its own working directory, so exports that
+    # share an export folder never touch each other's partial movie files
+    os.makedirs(job['export_dir'], exist_ok=True)
+    work_dir = tempfile.mkdtemp(prefix=".render_", dir=job['export_dir'])
+    try:
+        with tempconfig(export_config(job, work_dir)):
+            windows = plan_slices(job, config.frame_rate, job['render_processes'])
+            if len(windows) > 1:
+                # The slice processes are timed as a whole
+                with timed('frames'):
+                    render_slices(job, windows, work_dir, progress, is_cancelled)
+            else:
+                segments = export_segments(job)
+                monitor = ExportMonitor(
+                    sum(round(duration * config.frame_rate) for _, duration in segments),
+                    [name for name, _ in segments],
+                    report=progress,
+                    is_cancelled=is_cancelled
+                )
+                scene = ANIMATION_SCENES[job['source']](
+                    job, monitor=monitor, is_cancelled=is_cancelled
+                )
+                with timed('frames'):
+                    scene.render()
+
+            video_file = os.path.join(config.video_dir, f"{job['output_file']}.mp4")
+            if os.path.exists(video_file):
+                with timed('encode'):
+                    encode_formats(video_file, job['formats'], job['ladder'], is_cancelled)
+
+        # Clean up extra files, keeping only the exported formats
+        with timed('cleanup'):
+            final_paths = cleanup_export_files(
+                work_dir, job['export_dir'], job['output_file'], job['formats'], job['ladder']
+            )
+            if cache is not None:
+                try:
+                    cache.store(cache_key, output_path, final_paths)
+                except OSError:
+                    pass
+            return final_paths
+    finally:
+        with timed('cleanup'):
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def warm_up():
+    """Load fonts and Pango once so the first real render is fast"""
+    prune_media(force=True)
+    try:
+        Text("ManimUI")
+    except Exception:
+        pass
+
+
+def run_job(job, progress=None, is_cancelled=None):
+    """Run a preview, timeline, frame, stills or export job and return its result.
+
+    Every stage of the job is timed; see render_timing.
+    """
+    if job['kind'] == 'preview':
+        return run_timed(job, lambda: render_preview(job, is_cancelled))
+    if job['kind'] == 'timeline':
+        return run_timed(job, lambda: render_timeline(job, progress, is_cancelled))
+    if job['kind'] == 'frame':
+        return run_timed(job, lambda: render_frame(job, job['time'], is_cancelled))
+    if job['kind'] == 'stills':
+        return run_timed(job, lambda: render_stills(job))
+    return run_timed(job, lambda: render_export(job, progress, is_cancelled))
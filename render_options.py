@@ -0,0 +1,198 @@
+"""Choices offered by the editor and the jobs made from them, importable
+without loading manim.
+
+The animation tables map friendly names to "module:attribute" paths
+that are only imported on the first lookup, so the GUI can list the
+names at startup while manim loads in the render process.
+"""
+import importlib
+from collections.abc import Mapping
+
+
+class LazyTable(Mapping):
+    """Read-only mapping whose values are imported on first lookup"""
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.values = {}
+
+    def __getitem__(self, name):
+        if name not in self.values:
+            module, attribute = self.paths[name].split(":")
+            self.values[name] = getattr(importlib.import_module(module), attribute)
+        return self.values[name]
+
+    def __contains__(self, name):
+        # Checking a name must not import its value
+        return name in self.paths
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+
+# Animation methods offered on the Text Animation tab
+TEXT_ANIMATIONS_IN = LazyTable({
+    "Simple Fade In": "manim:FadeIn",
+    "Write Text": "manim:Write",
+    "Create": "manim:Create",
+    "Grow from Center": "manim:GrowFromCenter",
+    "Draw with Border": "manim:DrawBorderThenFill"
+})
+
+TEXT_ANIMATIONS_OUT = LazyTable({
+    "Simple Fade Out": "manim:FadeOut",
+    "Erase Text": "manim:Unwrite",
+    "Uncreate": "manim:Uncreate",
+    "Shrink to Center": "manim:ShrinkToCenter"
+})
+
+# Animation methods offered on the SVG Animation tab
+SVG_ANIMATIONS_IN = LazyTable({
+    "Draw Border Then Fill": "manim:DrawBorderThenFill",
+    "Create": "manim:Create",
+    "Fade In": "manim:FadeIn",
+    "Grow From Center": "manim:GrowFromCenter",
+    "Show Increasing Subsets": "manim:ShowIncreasingSubsets",
+    "Write": "manim:Write",
+    "Spiral In": "render_core:spiral_in",
+    "Scale From Point": "render_core:smooth_create",
+    "Rotate In": "render_core:smooth_create"
+})
+
+SVG_ANIMATIONS_OUT = LazyTable({
+    "Uncreate": "manim:Uncreate",
+    "Fade Out": "manim:FadeOut",
+    "Shrink To Center": "manim:ShrinkToCenter",
+    "Unwrite": "manim:Unwrite",
+    "Show Decreasing Subsets": "render_core:show_decreasing_subsets",
+    "Spiral Out": "render_core:spiral_out",
+    "Scale To Point": "render_core:smooth_uncreate",
+    "Rotate Out": "render_core:smooth_uncreate"
+})
+
+# Quality options with friendly names
+QUALITY_OPTIONS = {
+    "Low Quality (Fast)": "low_quality",
+    "Medium Quality": "medium_quality",
+    "High Quality": "high_quality",
+    "Production Quality (Slow)": "production_quality"
+}
+
+EXPORT_FORMATS = {
+    "MP4 (H.264)": "mp4",
+    "WebM (VP9)": "webm",
+    "GIF": "gif",
+    "PNG Sequence": "png"
+}
+
+# Rungs of the resolution ladder: frame height and default H.264 bitrate
+RESOLUTION_LADDER = {
+    "2160p": (2160, "35M"),
+    "1440p": (1440, "16M"),
+    "1080p": (1080, "8M"),
+    "720p": (720, "5M"),
+    "480p": (480, "2500k"),
+    "360p": (360, "1M")
+}
+
+ANIMATION_TABLES = {
+    'text': (TEXT_ANIMATIONS_IN, TEXT_ANIMATIONS_OUT),
+    'svg': (SVG_ANIMATIONS_IN, SVG_ANIMATIONS_OUT)
+}
+
+
+# Settings a job gets when it doesn't specify them, matching the editor's defaults
+JOB_DEFAULTS = {
+    'text': {
+        'latex': False,
+        'font_size': 48,
+        'gradient': False,
+        'color': "#FFFFFF",
+        'gradient_colors': ("#FF0000", "#0000FF"),
+        'fade_in': "Simple Fade In",
+        'fade_in_duration': 1,
+        'wait_duration': 2,
+        'fade_out': "Simple Fade Out",
+        'fade_out_duration': 1,
+        'quality': "medium_quality",
+        'formats': ["mp4"],
+        'ladder': {},
+        'render_processes': 1
+    },
+    'svg': {
+        'scale': 4,
+        'fade_in': "Draw Border Then Fill",
+        'fade_in_duration': 5,
+        'wait_duration': 10,
+        'fade_out': "Uncreate",
+        'fade_out_duration': 15,
+        'quality': "medium_quality",
+        'formats': ["mp4"],
+        'ladder': {},
+        'render_processes': 1
+    }
+}
+
+JOB_REQUIRED = {
+    'text': ('content', 'output_file', 'export_dir'),
+    'svg': ('svg_path', 'output_file', 'export_dir')
+}
+
+
+def normalize_job(job):
+    """Put the quality, formats and ladder of a job in the form the renderer expects.
+
+    Jobs from the editor and from batch files both pass through here, so
+    the same settings always make the same job. A ladder is a list of
+    rungs, or a dict of rungs to bitrates, and becomes a dict in which
+    every rung has a bitrate. Returns job, changed in place.
+    """
+    # Accept the friendly quality names shown in the editor as well
+    job['quality'] = QUALITY_OPTIONS.get(job['quality'], job['quality'])
+    if isinstance(job['formats'], str):
+        job['formats'] = [job['formats']]
+    job['formats'] = [EXPORT_FORMATS.get(name, name) for name in job['formats']]
+    unknown = [name for name in job['formats'] if name not in EXPORT_FORMATS.values()]
+    if unknown:
+        raise ValueError(f"Unknown export formats: {', '.join(unknown)}")
+    if not isinstance(job['ladder'], dict):
+        job['ladder'] = {rung: None for rung in job['ladder']}
+    unknown = [rung for rung in job['ladder'] if rung not in RESOLUTION_LADDER]
+    if unknown:
+        raise ValueError(f"Unknown resolution ladder rungs: {', '.join(unknown)}")
+    job['ladder'] = {
+        rung: bitrate or RESOLUTION_LADDER[rung][1] for rung, bitrate in job['ladder'].items()
+    }
+    return job
+
+
+def make_job(spec, kind='export'):
+    """Complete a partial job spec with the editor's defaults and check it"""
+    source = spec.get('source', 'svg' if 'svg_path' in spec else 'text')
+    if source not in JOB_DEFAULTS:
+        raise ValueError(f"Unknown job source: {source}")
+
+    job = dict(JOB_DEFAULTS[source])
+    job.update(spec)
+    job['source'] = source
+    job['kind'] = kind
+    normalize_job(job)
+    if not job['formats']:
+        raise ValueError("No export formats given")
+    if job['ladder'] and "mp4" not in job['formats']:
+        raise ValueError("A resolution ladder is a set of MP4 sizes; add mp4 to the formats")
+
+    animations_in, animations_out = ANIMATION_TABLES[source]
+    for key, table in (('fade_in', animations_in), ('fade_out', animations_out)):
+        if job[key] not in table:
+            raise ValueError(
+                f"Unknown {key} animation {job[key]!r}; choose from {', '.join(table)}"
+            )
+
+    missing = [key for key in JOB_REQUIRED[source] if not job.get(key)]
+    if missing:
+        raise ValueError(f"Job is missing {', '.join(missing)}")
+    return job
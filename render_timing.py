@@ -0,0 +1,136 @@
+import os
+import json
+import time
+import cProfile
+from contextlib import contextmanager
+
+import render_cache
+
+# Stages of a render, in the order they are shown
+STAGE_NAMES = {
+    'build': "Mobject build",
+    'latex': "LaTeX compile",
+    'frames': "Cairo frames",
+    'encode': "ffmpeg encoding",
+    'cleanup': "Cleanup",
+    'other': "Other"
+}
+
+TIMINGS_LOG = os.path.join(render_cache.user_cache_dir(), "render_timings.jsonl")
+PROFILE_DIR = os.path.join(render_cache.user_cache_dir(), "profiles")
+
+# Timings of the job running in this process, and of the last one that ran
+current_timings = None
+last_timings = None
+
+
+class StageTimings:
+    """Wall time spent in each stage of one render.
+
+    Stages nest, and time spent in an inner stage is not counted for the
+    stage around it, so the stages add up to the total.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self.stack = []
+        self.start_time = time.perf_counter()
+
+    def add(self, stage, seconds):
+        self.seconds[stage] = self.seconds.get(stage, 0) + seconds
+
+    @contextmanager
+    def stage(self, name):
+        now = time.perf_counter()
+        if self.stack:
+            outer, outer_start = self.stack[-1]
+            self.add(outer, now - outer_start)
+        self.stack.append((name, now))
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, start = self.stack.pop()
+            self.add(name, now - start)
+            if self.stack:
+                self.stack[-1] = (self.stack[-1][0], now)
+
+    def summary(self):
+        total = time.perf_counter() - self.start_time
+        stages = {stage: self.seconds[stage] for stage in STAGE_NAMES if stage in self.seconds}
+        stages['other'] = max(total - sum(stages.values()), 0)
+        return {'total': total, 'stages': stages}
+
+
+@contextmanager
+def timed(stage):
+    """Count the time spent in the block for a stage of the running job"""
+    timings = current_timings
+    if timings is None:
+        yield
+    else:
+        with timings.stage(stage):
+            yield
+
+
+def append_log(entry):
+    try:
+        os.makedirs(os.path.dirname(TIMINGS_LOG), exist_ok=True)
+        with open(TIMINGS_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+    except OSError:
+        pass
+
+
+def profile_path(job):
+    """Where the profile of a job goes: its 'profile' path, or one in PROFILE_DIR"""
+    if isinstance(job['profile'], str):
+        return job['profile']
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}_{job['kind']}_{job.get('output_file') or 'preview'}.prof"
+    return os.path.join(PROFILE_DIR, name)
+
+
+def run_timed(job, run):
+    """Call run() for a job while timing its stages, and return its result.
+
+    The timings are appended to TIMINGS_LOG and kept in last_timings. A
+    job with 'profile' set also runs under cProfile, and the stats are
+    dumped in the pstats format that snakeviz and friends read.
+    """
+    global current_timings, last_timings
+    current_timings = StageTimings()
+    profiler = cProfile.Profile() if job.get('profile') else None
+    error = None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        return run()
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        last_timings = current_timings.summary()
+        current_timings = None
+        if profiler is not None:
+            last_timings['profile'] = profile_path(job)
+            profiler.dump_stats(last_timings['profile'])
+        append_log(dict(
+            last_timings,
+            time=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            kind=job['kind'],
+            source=job['source'],
+            output_file=job.get('output_file'),
+            quality=job.get('quality'),
+            error=error
+        ))
+
+
+def format_timings(timings):
+    """Multi-line summary of timings for display"""
+    lines = [f"Total: {timings['total']:.2f} s"]
+    for stage, seconds in timings['stages'].items():
+        lines.append(f"  {STAGE_NAMES[stage]}: {seconds:.2f} s")
+    return "\n".join(lines)
@@ -0,0 +1,123 @@
+import atexit
+import multiprocessing
+
+
+class RenderWorkerCrashed(RuntimeError):
+    """Raised when the render process dies in the middle of a job"""
+
+
+class RenderCancelled(Exception):
+    """Raised when a render is stopped on request"""
+
+
+def worker_main(conn, cancelled_id):
+    """Entry point of the render process: import manim once and serve jobs.
+
+    cancelled_id holds the job_id of the job to cancel, so a cancel meant
+    for one job can never stop another.
+    """
+    import render_core
+    import render_timing
+
+    render_core.warm_up()
+    conn.send(('ready', None))
+
+    def report_progress(info):
+        conn.send(('progress', info))
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        def is_cancelled(job_id=job.get('job_id')):
+            return job_id is not None and cancelled_id.value == job_id
+
+        try:
+            result = render_core.run_job(job, report_progress, is_cancelled)
+        except RenderCancelled as e:
+            reply = ('cancelled', str(e))
+        except Exception as e:
+            reply = ('error', str(e))
+        else:
+            reply = ('ok', result)
+        conn.send(('timings', render_timing.last_timings))
+        conn.send(reply)
+
+
+class RenderWorker:
+    """Client side of a long-lived render process that keeps manim loaded.
+
+    Jobs are sent over a pipe one at a time. If the process dies (for
+    example a crash inside Cairo) the job fails and a fresh process is
+    started so the next job finds a warm worker again.
+    """
+
+    def __init__(self):
+        self.context = multiprocessing.get_context('spawn')
+        self.process = None
+        self.conn = None
+        self.cancelled_id = self.context.Value('q', -1)
+        self.closed = False
+        atexit.register(self.stop)
+
+    def start(self):
+        parent_conn, child_conn = self.context.Pipe()
+        # Not a daemon, since segmented exports start processes of their own;
+        # stop() is registered to run at exit so the process never outlives us
+        self.process = self.context.Process(target=worker_main, args=(child_conn, self.cancelled_id))
+        self.process.start()
+        # Only the child keeps its end open, so its death shows up as EOF here
+        child_conn.close()
+        self.conn = parent_conn
+
+    def wait_ready(self):
+        """Block until the render process has loaded manim and warmed up"""
+        try:
+            self.conn.recv()
+        except (EOFError, OSError):
+            self.conn.close()
+            raise RenderWorkerCrashed("The render process could not start")
+
+    def is_alive(self):
+        return self.process is not None and self.process.is_alive()
+
+    def run(self, job, progress=None, timings=None):
+        """Run a job in the render process and return its result.
+
+        progress, if given, is called with each progress report the
+        render process sends while the job runs, and timings with the
+        job's stage timings once it is done, whether it succeeded or not.
+        """
+        if not self.is_alive():
+            self.start()
+        try:
+            self.conn.send(job)
+            status, payload = self.conn.recv()
+            while status in ('ready', 'progress', 'timings'):
+                callback = {'progress': progress, 'timings': timings}.get(status)
+                if callback is not None:
+                    callback(payload)
+                status, payload = self.conn.recv()
+        except (EOFError, OSError):
+            self.conn.close()
+            if not self.closed:
+                self.start()
+            raise RenderWorkerCrashed("The render process crashed and has been restarted")
+        if status == 'cancelled':
+            raise RenderCancelled(payload)
+        if status == 'error':
+            raise RuntimeError(payload)
+        return payload
+
+    def cancel(self, job_id):
+        """Ask the render process to stop the job with this job_id"""
+        self.cancelled_id.value = job_id
+
+    def stop(self):
+        self.closed = True
+        if self.is_alive():
+            self.process.terminate()
+            self.process.join(1)
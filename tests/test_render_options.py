@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import render_options
+
+
+def test_list_ladder_becomes_rungs_with_default_bitrates():
+    job = render_options.normalize_job({
+        'quality': "medium_quality",
+        'formats': ["mp4"],
+        'ladder': ["1080p", "720p"]
+    })
+    assert job['ladder'] == {"1080p": "8M", "720p": "5M"}
+
+
+def test_editor_and_batch_ladders_make_the_same_job():
+    spec = {'content': "Hi", 'output_file': "hi", 'export_dir': "out"}
+    from_list = render_options.make_job(dict(spec, ladder=["720p"]))
+    from_dict = render_options.make_job(dict(spec, ladder={"720p": None}))
+    assert from_list == from_dict
+
+
+def test_unknown_rung_is_rejected():
+    with pytest.raises(ValueError):
+        render_options.normalize_job({'quality': "medium_quality", 'formats': ["mp4"], 'ladder': ["999p"]})
+
+
+def test_ladder_without_mp4_is_rejected():
+    with pytest.raises(ValueError):
+        render_options.make_job({
+            'content': "Hi", 'output_file': "hi", 'export_dir': "out",
+            'formats': ["gif"], 'ladder': ["720p"]
+        })